@@ -6,13 +6,20 @@ import discord
 from discord.ext import commands, tasks
 from discord import app_commands
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, ReadPreference, ReturnDocument, WriteConcern
+from pymongo.errors import BulkWriteError, ConnectionFailure
 from datetime import datetime, timedelta
 import os
 from typing import Optional, List, Dict
+from collections import defaultdict, OrderedDict
 import pytz
 from dotenv import load_dotenv
 import logging
 import asyncio
+import contextlib
+import functools
+import heapq
+import time
 from .leaderboard_config import (
     EMBED_COLOR, Emojis, Images, VoiceTemplates, 
     PeriodConfig, ButtonConfig, LeaderboardSettings
@@ -20,6 +27,106 @@ from .leaderboard_config import (
 
 load_dotenv()
 
+# Every zone name pytz accepts, lowercased (pytz matches names case-insensitively)
+KNOWN_TZ_NAMES = frozenset(name.lower() for name in pytz.all_timezones_set)
+
+
+@functools.lru_cache(maxsize=256)
+def _safe_tz(name: str):
+    """Cached pytz lookup - unknown names return None by set membership instead of raising"""
+    if not name or name.lower() not in KNOWN_TZ_NAMES:
+        return None
+    try:
+        return pytz.timezone(name)
+    except Exception:
+        return None
+
+
+class AsyncKeyedLock:
+    """Per-key asyncio locks, dropped again once no task holds or waits on them"""
+    
+    def __init__(self):
+        self._locks = {}  # {key: [asyncio.Lock, holders_and_waiters]}
+    
+    @contextlib.asynccontextmanager
+    async def lock(self, key):
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
+
+# Leaderboard row template, bound once at import
+ROW_FMT = "- `{idx:02d}` | `{username}` " + Emojis.ARROW + " `{time}`"
+
+# guild_configs fields read by the periodic tick
+TICK_CONFIG_PROJECTION = {
+    '_id': 0, 'guild_id': 1, 'voice_enabled': 1, 'timezone': 1, 'voice_channel_id': 1,
+    'vibe_channel_id': 1, 'last_voice_daily_reset': 1, 'last_voice_weekly_reset': 1, 'last_voice_monthly_reset': 1
+}
+
+# guild_configs fields the cog reads through _get_guild_config (and keeps in its config cache)
+CONFIG_PROJECTION = {'_id': 0, 'voice_enabled': 1, 'voice_channel_id': 1, 'timezone': 1, 'vibe_channel_id': 1}
+
+# user_stats field holding each period's voice minutes
+PERIOD_FIELDS = {'daily': 'voice_daily', 'weekly': 'voice_weekly', 'monthly': 'voice_monthly', 'alltime': 'voice_alltime'}
+
+# Bulk write error codes worth resending (write conflicts, elections, shutdowns, network blips)
+TRANSIENT_WRITE_CODES = frozenset({6, 7, 89, 91, 112, 189, 262, 9001, 10107, 11600, 11602, 13435, 13436})
+
+# /live-leaderboard-voice replies - static ones are plain constants, *_FMT take str.format fields
+MSG_ALREADY_DISABLED = "⚠️ Voice leaderboard is already disabled!"
+MSG_DISABLED = (
+    "✅ **Voice leaderboard disabled!**\n"
+    "📊 Voice time tracking has been paused.\n"
+    "💡 Use `/live-leaderboard-voice action:Enable` to re-enable."
+)
+MSG_NOT_CONFIGURED = (
+    "⚠️ Voice leaderboard not configured yet!\n"
+    "💡 Use `/live-leaderboard-voice action:Setup` first."
+)
+MSG_ALREADY_ENABLED = "⚠️ Voice leaderboard is already enabled!"
+MSG_ENABLED_FMT = (
+    "✅ **Voice leaderboard enabled!**\n"
+    "📊 Channel: {channel}\n"
+    "🌍 Timezone: `{tz}`\n"
+    "💡 Voice time tracking has resumed."
+)
+MSG_CHANNEL_REQUIRED = (
+    "❌ **Channel required for setup!**\n"
+    "Please provide a channel using the `voice_channel` parameter."
+)
+MSG_INVALID_TZ_FMT = (
+    "❌ Invalid timezone: `{tz}`\n"
+    "💡 Use IANA format (e.g., `America/New_York`, `Europe/London`, `Asia/Tokyo`)"
+)
+_SETUP_HEAD = "✅ **Voice leaderboard setup complete!**\n📊 Channel: {channel}\n🌍 Timezone: `{tz}`"
+_SETUP_TAIL = "\n🔄 Updates every 5 minutes\n💡 Use `/live-leaderboard-voice action:Disable` to pause tracking."
+MSG_SETUP_FMT = _SETUP_HEAD + _SETUP_TAIL
+MSG_SETUP_VIBE_FMT = _SETUP_HEAD + "\n🎵 Vibe Channel: {vibe}" + _SETUP_TAIL
+
+
+def _safe_followup(func):
+    """Report an unexpected command error to the invoking admin instead of failing silently"""
+    @functools.wraps(func)
+    async def wrapper(self, interaction: discord.Interaction, *args, **kwargs):
+        try:
+            return await func(self, interaction, *args, **kwargs)
+        except Exception as e:
+            self.logger.error(f"Error in /{interaction.command.name if interaction.command else '?'}: {e}", exc_info=True)
+            try:
+                await interaction.followup.send(f"❌ Error: {e}", ephemeral=True)
+            except discord.HTTPException:
+                pass
+    return wrapper
+
 
 class VoiceLeaderboardPaginator(discord.ui.View):
     def __init__(self, cog, guild_id: int, period: str, page: int = 0, vibe_channel_id: int = None):
@@ -105,11 +212,11 @@ class VoiceLeaderboardPaginator(discord.ui.View):
             
             # Use cached max_pages if available
             if self.max_pages_cache is None:
-                stats = await self.cog._get_top_users(self.guild_id, self.period, limit=LeaderboardSettings.MAX_MEMBERS_FETCH)
-                if not stats:
+                total = await self.cog._count_top_users(self.guild_id, self.period)
+                if not total:
                     await interaction.response.send_message("No data available!", ephemeral=True)
                     return
-                self.max_pages_cache = max(0, (len(stats) - 1) // LeaderboardSettings.MEMBERS_PER_PAGE)
+                self.max_pages_cache = max(0, (total - 1) // LeaderboardSettings.MEMBERS_PER_PAGE)
             
             if self.page < self.max_pages_cache:
                 self.page += 1
@@ -136,14 +243,63 @@ class VoiceLeaderboardCog(commands.Cog):
         self.bot = bot
         self.mongo_client = None
         self.db = None
-        self.voice_sessions = {}
-        self.voice_sessions_lock = asyncio.Lock()  # Prevent race conditions
-        self.session_save_queue = {}  # Buffer for pending saves
+        self.read_db = None  # self.db with secondaryPreferred reads, for leaderboard queries
+        self.toggle_configs = None  # guild_configs with a primary-only, unjournaled write concern for enable/disable
+        self.voice_sessions = OrderedDict()  # {(guild_id, user_id): joined_at}, oldest session first
+        self.max_tracked_sessions = 50000  # Oldest sessions are saved and evicted beyond this
+        self.voice_sessions_lock = asyncio.Lock()  # Guards whole-map passes (periodic save, shutdown, queue flush)
+        self._session_locks = AsyncKeyedLock()  # Serializes voice events per (guild_id, user_id)
+        self.session_save_queue = defaultdict(float)  # {(guild_id, user_id): minutes} of ended sessions awaiting a save
+        self.save_queue_batch_size = 128  # Flush early once this many members are queued
+        self._pending_inc = defaultdict(float)  # {(guild_id, user_id): minutes} - coalesced increments awaiting flush
+        self._session_heap = []  # [(expires_at, session_key)] - at most one entry per tracked key
+        self._session_heap_keys = set()  # Keys that currently have an entry in _session_heap
         self.max_session_duration = 10080  # Max 7 days in minutes
         self.last_daily_reset = {}  # {guild_id: datetime}
         self.last_weekly_reset = {}  # {guild_id: datetime}
         self.last_monthly_reset = {}  # {guild_id: datetime}
         self.view_cache = {}  # {(guild_id, period): view_instance} - cache views to preserve state
+        self._embed_cache = {}  # {guild_id: {(period, page): (built_at, embed)}} - short-lived render cache
+        self._embed_cache_ttl = 60  # seconds
+        self._last_month_cache = {}  # {guild_id: (expires_at_ts, winner_or_None)}
+        self._last_embed_hash = {}  # {(guild_id, period): hash} of the content last written to each message
+        self._msg_cache = {}  # {guild_id: (daily, weekly, monthly)} PartialMessages - edits need no fetch
+        self._cfg_cache = {}  # {guild_id: (fetched_at, config_or_None)} - written through by this cog's config writes
+        self._cfg_cache_ttl = 60  # seconds - bounds staleness of writes made by other cogs
+        self._afk_cache = {}  # {guild_id: afk_channel_id_or_None} - refreshed by on_guild_update
+        self._dirty_guilds = set()  # Guilds whose stats changed since their leaderboards were last refreshed
+        self._last_full_sweep = float('-inf')  # monotonic time of the last refresh of every guild (-inf: first tick sweeps)
+        self._full_sweep_interval = 3600  # seconds - safety net for refreshes the dirty set misses
+        self.tick_concurrency = 8  # Guilds processed at once by unified_tick
+        self._background_tasks = set()  # Strong refs to fire-and-forget tasks until they finish
+        self._pending_config_sets = {}  # {guild_id: {field: value}} admin toggles awaiting one bulk_write
+        self._config_flush_task = None  # Debounced flush of _pending_config_sets
+        self._config_flush_lock = asyncio.Lock()  # One guild_configs write batch in flight at a time
+        self.config_flush_delay = 0.25  # seconds a toggle may wait to share a bulk_write
+        self.config_flush_batch_size = 100  # Flush at once when this many guilds are pending
+        self._config_flush_failures = 0  # Consecutive failed flushes, drives the retry backoff
+        self.config_flush_max_backoff = 30  # seconds between retries of a failing flush, at most
+        # Per-period description builders with the static template kwargs pre-bound
+        self._desc_builders = {
+            p: functools.partial(
+                VoiceTemplates.build_description,
+                period_title=PeriodConfig.VOICE_TITLES[p],
+                subtitle=PeriodConfig.VOICE_SUBTITLES[p],
+                period=p
+            )
+            for p in ('monthly', 'weekly', 'daily')
+        }
+        # Static command replies, built once and reused by every invocation
+        self._embed_already_disabled = discord.Embed(description=MSG_ALREADY_DISABLED, color=EMBED_COLOR)
+        self._embed_already_enabled = discord.Embed(description=MSG_ALREADY_ENABLED, color=EMBED_COLOR)
+        self._embed_not_configured = discord.Embed(description=MSG_NOT_CONFIGURED, color=EMBED_COLOR)
+        self._embed_channel_required = discord.Embed(description=MSG_CHANNEL_REQUIRED, color=EMBED_COLOR)
+        # /live-leaderboard-voice action -> handler
+        self._dispatch = {
+            'enable': self._handle_enable,
+            'disable': self._handle_disable,
+            'setup': self._handle_setup
+        }
         self.logger = logging.getLogger('discord.bot.voice_leaderboard')
     
     async def cog_load(self):
@@ -161,6 +317,11 @@ class VoiceLeaderboardCog(commands.Cog):
             self.db = self.mongo_client['poison_bot']
             self.logger.info("Voice Leaderboard Cog: MongoDB connected")
         
+        # Leaderboard reads tolerate slight staleness - let secondaries serve them
+        self.read_db = self.db.with_options(read_preference=ReadPreference.SECONDARY_PREFERRED)
+        # A lost toggle is fixed by re-running the command, so it does not wait for journal/majority acks
+        self.toggle_configs = self.db.guild_configs.with_options(write_concern=WriteConcern(w=1, j=False))
+        
         # Create indexes for optimal performance
         await self._create_indexes()
         
@@ -170,54 +331,80 @@ class VoiceLeaderboardCog(commands.Cog):
     @commands.Cog.listener()
     async def on_ready(self):
         """Start tasks when bot is ready to avoid deadlock during cog loading"""
-        if not self.update_leaderboards.is_running():
-            self.update_leaderboards.start()
-            self.daily_reset.start()
-            self.weekly_reset.start()
-            self.monthly_reset.start()
+        if not self.unified_tick.is_running():
+            self.unified_tick.start()  # Resets and leaderboard updates
             self.save_voice_sessions_periodically.start()  # Periodic session saves
             self.periodic_session_cleanup.start()  # Hourly cleanup
+            self.flush_save_queue.start()  # 30s save-queue flush
             self.logger.info("Voice leaderboard tasks started")
     
     async def cog_unload(self):
+        await self._flush_config_writes()
+        # Queued time of ended sessions first - _save_all_voice_sessions clears the queue
+        async with self.voice_sessions_lock:
+            await self._process_save_queue()
         await self._save_all_voice_sessions()
-        self.update_leaderboards.cancel()
-        self.daily_reset.cancel()
-        self.weekly_reset.cancel()
-        self.monthly_reset.cancel()
+        await self._flush_pending_inc()
+        self.unified_tick.cancel()
         self.save_voice_sessions_periodically.cancel()
         self.periodic_session_cleanup.cancel()
+        self.flush_save_queue.cancel()
+        # A failed unload flush must not keep retrying against a cog that is gone
+        if self._config_flush_task is not None:
+            self._config_flush_task.cancel()
         # Don't close shared MongoDB connection - it's managed by the bot
         # Only close if we created our own connection
         if self.mongo_client and not hasattr(self.bot, 'mongo_client'):
             self.mongo_client.close()
     
+    @commands.Cog.listener()
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        """Forget the cached AFK channel when a guild changes it"""
+        if before.afk_channel != after.afk_channel:
+            self._afk_cache.pop(after.id, None)
+    
+    def _afk_id(self, guild: discord.Guild) -> Optional[int]:
+        """AFK channel id of a guild, cached until on_guild_update reports a change"""
+        try:
+            return self._afk_cache[guild.id]
+        except KeyError:
+            afk_id = self._afk_cache[guild.id] = guild.afk_channel.id if guild.afk_channel else None
+            return afk_id
+    
     @commands.Cog.listener()
     async def on_guild_remove(self, guild: discord.Guild):
         """Clean up data when bot is removed from a guild"""
         try:
             self.logger.info(f"Bot removed from guild {guild.name} ({guild.id}), cleaning up voice leaderboard data")
             
-            # Save any active voice sessions for this guild before cleanup
-            async with self.voice_sessions_lock:
-                sessions_to_remove = [(gid, uid) for (gid, uid) in self.voice_sessions.keys() if gid == guild.id]
-                for session_key in sessions_to_remove:
-                    del self.voice_sessions[session_key]
+            # Drop active voice sessions for this guild. No await happens while the
+            # dict is rebuilt, so the event loop already makes this atomic - no lock needed.
+            guild_id = guild.id
+            self.voice_sessions = OrderedDict((k, v) for k, v in self.voice_sessions.items() if k[0] != guild_id)
+            # Buffered minutes too, or the next flush would upsert them back into the zeroed stats
+            self.session_save_queue = defaultdict(float, ((k, v) for k, v in self.session_save_queue.items() if k[0] != guild_id))
+            self._pending_inc = defaultdict(float, ((k, v) for k, v in self._pending_inc.items() if k[0] != guild_id))
+            self._dirty_guilds.discard(guild_id)
             
             # Delete leaderboard messages
+            self._msg_cache.pop(guild_id, None)
             await self.db.leaderboard_messages.delete_one({'guild_id': guild.id, 'type': 'voice'})
             
             # Delete user stats (only voice fields - chat cog will handle chat)
             result = await self.db.user_stats.update_many(
-                {'guild_id': guild.id},
+                {'guild_id': guild.id, '$or': [{field: {'$gt': 0}} for field in PERIOD_FIELDS.values()]},
                 {'$set': {'voice_daily': 0, 'voice_weekly': 0, 'voice_monthly': 0, 'voice_alltime': 0}}
             )
             
-            # Update guild config to disable voice
-            await self.db.guild_configs.update_one(
-                {'guild_id': guild.id},
-                {'$set': {'voice_enabled': False}}
-            )
+            # Update guild config to disable voice - a queued toggle must not re-enable it afterwards
+            async with self._config_flush_lock:
+                self._pending_config_sets.pop(guild_id, None)
+                await self.db.guild_configs.update_one(
+                    {'guild_id': guild.id},
+                    {'$set': {'voice_enabled': False}}
+                )
+            self._cfg_cache.pop(guild.id, None)
+            self._afk_cache.pop(guild.id, None)
             
             self.logger.info(f"Voice leaderboard cleanup complete for guild {guild.id}")
         except Exception as e:
@@ -225,6 +412,7 @@ class VoiceLeaderboardCog(commands.Cog):
     
     async def _initialize_voice_sessions(self):
         # Bot is already ready when this is called from before_loop
+        now = datetime.utcnow()  # One timestamp for every session found at startup
         for guild in self.bot.guilds:
             config = await self._get_guild_config(guild.id)
             if not config or not config.get('voice_enabled'):
@@ -234,7 +422,7 @@ class VoiceLeaderboardCog(commands.Cog):
                     continue
                 for member in channel.members:
                     if not member.bot:
-                        self.voice_sessions[(guild.id, member.id)] = datetime.utcnow()
+                        self._start_session((guild.id, member.id), now)
         self.logger.info(f"Initialized {len(self.voice_sessions)} active voice sessions")
     
     async def _save_all_voice_sessions(self):
@@ -245,30 +433,35 @@ class VoiceLeaderboardCog(commands.Cog):
         async with self.voice_sessions_lock:
             saved_count = 0
             error_count = 0
+            now = datetime.utcnow()
             sessions_to_save = list(self.voice_sessions.items())
             
-            # Process in batches to avoid overwhelming the database
+            increments = []
+            for (guild_id, user_id), joined_at in sessions_to_save:
+                # Validate session data
+                if not isinstance(joined_at, datetime):
+                    self.logger.warning(f"Invalid session data for user {user_id}: {joined_at}")
+                    continue
+                minutes = (now - joined_at).total_seconds() / 60
+                if minutes > 0:
+                    increments.append(((guild_id, user_id), minutes))
+            
+            # Write batches concurrently so their round trips overlap;
+            # the semaphore bounds in-flight writes instead of sleeping between batches
             batch_size = 50
-            for i in range(0, len(sessions_to_save), batch_size):
-                batch = sessions_to_save[i:i + batch_size]
-                for (guild_id, user_id), joined_at in batch:
-                    try:
-                        # Validate session data
-                        if not isinstance(joined_at, datetime):
-                            self.logger.warning(f"Invalid session data for user {user_id}: {joined_at}")
-                            continue
-                            
-                        minutes = (datetime.utcnow() - joined_at).total_seconds() / 60
-                        if minutes > 0:
-                            await self._increment_voice_time(guild_id, user_id, minutes)
-                            saved_count += 1
-                    except Exception as e:
-                        error_count += 1
-                        self.logger.error(f"Error saving voice session for user {user_id} in guild {guild_id}: {e}")
-                
-                # Small delay between batches
-                if i + batch_size < len(sessions_to_save):
-                    await asyncio.sleep(0.1)
+            sem = asyncio.Semaphore(20)
+            
+            async def _save_batch(batch):
+                async with sem:
+                    return await self._bulk_increment_voice_time(batch)
+            
+            batches = [increments[i:i + batch_size] for i in range(0, len(increments), batch_size)]
+            results = await asyncio.gather(*(_save_batch(b) for b in batches), return_exceptions=True)
+            for batch, failed in zip(batches, results):
+                if isinstance(failed, BaseException):
+                    failed = batch
+                saved_count += len(batch) - len(failed)
+                error_count += len(failed)
             
             # Clear all sessions and save queue
             self.voice_sessions.clear()
@@ -286,10 +479,19 @@ class VoiceLeaderboardCog(commands.Cog):
             
             # User stats indexes for voice queries
             await self.db.user_stats.create_index([('guild_id', 1), ('user_id', 1)], unique=True)
-            await self.db.user_stats.create_index([('guild_id', 1), ('voice_daily', -1)])
-            await self.db.user_stats.create_index([('guild_id', 1), ('voice_weekly', -1)])
-            await self.db.user_stats.create_index([('guild_id', 1), ('voice_monthly', -1)])
-            await self.db.user_stats.create_index([('guild_id', 1), ('voice_alltime', -1)])
+            # Partial compound indexes cover the leaderboard query (filter, sort and projection)
+            for period in ('daily', 'weekly', 'monthly', 'alltime'):
+                field = f'voice_{period}'
+                # Drop the old non-covering sort index - the compound one replaces it
+                try:
+                    await self.db.user_stats.drop_index(f'guild_id_1_{field}_-1')
+                except:
+                    pass  # Index doesn't exist, that's fine
+                await self.db.user_stats.create_index(
+                    [('guild_id', 1), (field, -1), ('user_id', 1)],
+                    partialFilterExpression={field: {'$gt': 0}},
+                    name=f'lb_{field}'
+                )
             
             # Leaderboard messages indexes
             await self.db.leaderboard_messages.create_index([('guild_id', 1), ('type', 1)], unique=True)
@@ -316,20 +518,82 @@ class VoiceLeaderboardCog(commands.Cog):
             self.logger.warning(f"Error creating indexes (may already exist): {e}")
     
     async def _get_guild_config(self, guild_id: int) -> Optional[Dict]:
-        return await self.db.guild_configs.find_one({'guild_id': guild_id})
-    
-    async def _ensure_guild_config(self, guild_id: int) -> Dict:
-        config = await self._get_guild_config(guild_id)
-        if not config:
-            config = {'guild_id': guild_id, 'voice_enabled': False, 'voice_channel_id': None, 'timezone': 'UTC', 'leaderboard_limit': 10, 'created_at': datetime.utcnow()}
-            await self.db.guild_configs.insert_one(config)
+        """Guild config from a short TTL cache - voice events read it on every state change"""
+        cached = self._cfg_cache.get(guild_id)
+        if cached and time.monotonic() - cached[0] < self._cfg_cache_ttl:
+            return cached[1]
+        config = await self.read_db.guild_configs.find_one({'guild_id': guild_id}, CONFIG_PROJECTION)
+        self._cfg_cache[guild_id] = (time.monotonic(), config)
         return config
     
-    async def _increment_voice_time(self, guild_id: int, user_id: int, minutes: float, max_retries: int = 3):
-        """Increment voice time with validation, error handling, and retry logic"""
+    def _log_task_error(self, task: asyncio.Task):
+        """Done callback for background tasks - release the task and log its failure"""
+        self._background_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            self.logger.error(f"Background task failed: {exc}", exc_info=exc)
+    
+    def _queue_config_set(self, guild_id: int, fields: Dict):
+        """Queue a guild_configs $set for the next bulk flush and apply it to the cache now"""
+        self._pending_config_sets.setdefault(guild_id, {}).update(fields)
+        self._update_cached_config(guild_id, fields)
+        if len(self._pending_config_sets) >= self.config_flush_batch_size:
+            task = asyncio.create_task(self._flush_config_writes())
+        elif self._config_flush_task is None or self._config_flush_task.done():
+            task = self._config_flush_task = asyncio.create_task(self._flush_config_writes(self.config_flush_delay))
+        else:
+            return
+        self._background_tasks.add(task)
+        task.add_done_callback(self._log_task_error)
+    
+    async def _flush_config_writes(self, delay: float = 0):
+        """Write queued guild_configs $sets with one unordered bulk_write"""
+        if delay:
+            await asyncio.sleep(delay)
+        # Serialized so setup and guild removal can wait out a batch that is already in flight
+        async with self._config_flush_lock:
+            if not self._pending_config_sets:
+                return
+            pending, self._pending_config_sets = self._pending_config_sets, {}
+            try:
+                await self.toggle_configs.bulk_write(
+                    [UpdateOne({'guild_id': guild_id}, {'$set': fields}) for guild_id, fields in pending.items()],
+                    ordered=False
+                )
+                self._config_flush_failures = 0
+            except Exception as e:
+                self.logger.error(f"Error flushing {len(pending)} guild config writes: {e}")
+                # Re-queue, letting anything set since the swap win
+                for guild_id, fields in pending.items():
+                    self._pending_config_sets[guild_id] = {**fields, **self._pending_config_sets.get(guild_id, {})}
+                    # The cache must not claim a write that did not land
+                    self._cfg_cache.pop(guild_id, None)
+                # Retry with exponential backoff instead of waiting for the next toggle
+                self._config_flush_failures += 1
+                delay = min(self.config_flush_delay * 2 ** self._config_flush_failures, self.config_flush_max_backoff)
+                task = self._config_flush_task = asyncio.create_task(self._flush_config_writes(delay))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._log_task_error)
+    
+    def _update_cached_config(self, guild_id: int, fields: Dict):
+        """Apply a guild_configs $set to the cached config so the next read skips Mongo"""
+        cached = self._cfg_cache.get(guild_id)
+        if cached and cached[1] is not None:
+            cached[1].update(fields)
+            self._cfg_cache[guild_id] = (time.monotonic(), cached[1])
+        else:
+            # Nothing cached to patch - let the next read fetch the full document
+            self._cfg_cache.pop(guild_id, None)
+    
+    async def _increment_voice_time(self, guild_id: int, user_id: int, minutes: float):
+        """Validate and queue a voice time increment (flushed in bulk by _flush_pending_inc)"""
         # Validate input
         if minutes <= 0:
-            self.logger.debug(f"Skipping voice increment for user {user_id}: minutes={minutes}")
+            # Guarded so the f-string isn't built on the hot path when debug logging is off
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Skipping voice increment for user {user_id}: minutes={minutes}")
             return
         
         # Round to avoid float precision issues
@@ -342,77 +606,214 @@ class VoiceLeaderboardCog(commands.Cog):
         elif minutes > 1440:  # 1-7 days (log but allow - some users stay in VC long-term)
             self.logger.info(f"Long voice session detected: {minutes:.1f} minutes ({minutes/60:.1f} hours) for user {user_id} in guild {guild_id}")
         
-        # Retry logic for database operations
+        # Coalesce in memory - written out by _flush_pending_inc
+        self._pending_inc[(guild_id, user_id)] += minutes
+        self._dirty_guilds.add(guild_id)
+    
+    async def _flush_pending_inc(self):
+        """Write all coalesced voice increments with a single bulk_write (resets call it first so minutes land in the period they were earned in)"""
+        if not self._pending_inc:
+            return
+        
+        # Swap the buffer so increments arriving during the write land in a fresh dict
+        pending, self._pending_inc = self._pending_inc, defaultdict(float)
+        # Put back only the minutes that did not land so the next flush retries them
+        for session_key, minutes in await self._bulk_increment_voice_time(pending.items()):
+            self._pending_inc[session_key] += minutes
+        
+        for guild_id in {guild_id for guild_id, _ in pending}:
+            self._invalidate_embed_cache(guild_id)
+    
+    async def _bulk_increment_voice_time(self, increments: List, max_retries: int = 3) -> List:
+        """Apply many ((guild_id, user_id), minutes) increments in one bulk_write; returns the increments that did not land"""
+        ops = []
+        queued = []  # The increment behind each op, index-aligned with ops
+        for (guild_id, user_id), minutes in increments:
+            capped = round(min(minutes, self.max_session_duration), 2)
+            if capped <= 0:
+                continue
+            queued.append(((guild_id, user_id), minutes))
+            minutes = capped
+            ops.append(UpdateOne(
+                {'guild_id': guild_id, 'user_id': user_id},
+                {
+                    '$inc': {
+                        'voice_daily': minutes,
+                        'voice_weekly': minutes,
+                        'voice_monthly': minutes,
+                        'voice_alltime': minutes
+                    },
+                    # Stamped server-side - no client clock skew, nothing to encode
+                    '$currentDate': {'last_update': True}
+                },
+                upsert=True
+            ))
+        if not ops:
+            return []
+        
         for attempt in range(max_retries):
             try:
-                result = await self.db.user_stats.update_one(
-                    {'guild_id': guild_id, 'user_id': user_id},
-                    {
-                        '$inc': {
-                            'voice_daily': minutes, 
-                            'voice_weekly': minutes, 
-                            'voice_monthly': minutes, 
-                            'voice_alltime': minutes
-                        }, 
-                        '$set': {'last_update': datetime.utcnow()}
-                    },
-                    upsert=True
-                )
-                if result.acknowledged:
-                    return
+                await self.db.user_stats.bulk_write(ops, ordered=False)
+                return []
+            except BulkWriteError as e:
+                # Unordered: every op without a write error was applied - resend only transient failures
+                errors = e.details.get('writeErrors', [])
+                retry = [err['index'] for err in errors if err.get('code') in TRANSIENT_WRITE_CODES]
+                if len(retry) < len(errors):
+                    self.logger.error(f"Dropping {len(errors) - len(retry)} voice increments with permanent write errors: {errors[0].get('errmsg')}")
+                if not retry:
+                    return []  # Permanent failures would fail again; everything else landed
+                ops = [ops[i] for i in retry]
+                queued = [queued[i] for i in retry]
+                error = e
+            except ConnectionFailure as e:
+                # Network errors (AutoReconnect included) - the batch as a whole is resent
+                error = e
             except Exception as e:
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
-                    self.logger.warning(f"Retry {attempt + 1}/{max_retries} for voice increment: {e}")
-                else:
-                    self.logger.error(f"Failed to increment voice time after {max_retries} attempts for user {user_id} in guild {guild_id}: {e}")
+                self.logger.error(f"Failed to bulk increment voice time ({len(ops)} ops): {e}")
+                return queued
+            if attempt < max_retries - 1:
+                await asyncio.sleep(1 * (attempt + 1))  # Exponential backoff
+                self.logger.warning(f"Retry {attempt + 1}/{max_retries} for bulk voice increment: {error}")
+            else:
+                self.logger.error(f"Failed to bulk increment voice time after {max_retries} attempts ({len(ops)} ops): {error}")
+        return queued
     
     async def _get_top_users(self, guild_id: int, period: str, limit: int = 100) -> List[Dict]:
         """Get top users with error handling and validation"""
         try:
-            field_map = {'daily': 'voice_daily', 'weekly': 'voice_weekly', 'monthly': 'voice_monthly', 'alltime': 'voice_alltime'}
-            field = field_map.get(period, 'voice_weekly')
+            field = PERIOD_FIELDS.get(period, 'voice_weekly')
             
             # Validate limit to prevent excessive queries
             limit = min(limit, LeaderboardSettings.MAX_MEMBERS_FETCH)
             
-            cursor = self.db.user_stats.find({'guild_id': guild_id, field: {'$gt': 0}}).sort(field, -1).limit(limit)
+            # Project only indexed fields so the query is answered from the lb_voice_* index
+            cursor = self.read_db.user_stats.find(
+                {'guild_id': guild_id, field: {'$gt': 0}},
+                {'_id': 0, 'user_id': 1, field: 1}
+            ).sort(field, -1).limit(limit)
             return await cursor.to_list(length=limit)
         except Exception as e:
             self.logger.error(f"Error fetching top users for guild {guild_id}, period {period}: {e}")
             return []
     
+    async def _get_page_and_totals(self, guild_id: int, period: str, page: int):
+        """Fetch (page_stats, top_stat, total_minutes, total_count) for one page in a single $facet round trip"""
+        try:
+            field = PERIOD_FIELDS.get(period, 'voice_weekly')
+            pipeline = [
+                {'$match': {'guild_id': guild_id, field: {'$gt': 0}}},
+                {'$sort': {field: -1}},
+                {'$limit': LeaderboardSettings.MAX_MEMBERS_FETCH},
+                {'$project': {'_id': 0, 'user_id': 1, field: 1}},
+                {'$facet': {
+                    'page': [
+                        {'$skip': page * LeaderboardSettings.MEMBERS_PER_PAGE},
+                        {'$limit': LeaderboardSettings.MEMBERS_PER_PAGE}
+                    ],
+                    'top': [{'$limit': 1}],
+                    'totals': [{'$group': {'_id': None, 'total': {'$sum': f'${field}'}, 'count': {'$sum': 1}}}]
+                }}
+            ]
+            result = await self.read_db.user_stats.aggregate(pipeline, hint=f'lb_{field}').to_list(length=1)
+            facets = result[0] if result else {}
+            totals = facets.get('totals') or [{}]
+            top = facets.get('top') or [None]
+            return facets.get('page', []), top[0], totals[0].get('total', 0), totals[0].get('count', 0)
+        except Exception as e:
+            self.logger.error(f"Error fetching leaderboard page for guild {guild_id}, period {period}: {e}")
+            return [], None, 0, 0
+    
+    async def _bulk_leaderboards(self, guild_ids: List[int]) -> Dict[int, Dict]:
+        """Fetch page 0 of every period for many guilds as {guild_id: {period: _get_page_and_totals tuple}}"""
+        if not guild_ids:
+            return {}
+        periods = ('daily', 'weekly', 'monthly')
+        
+        async def _ranked(period):
+            field = PERIOD_FIELDS[period]
+            # Each guild is cut to MAX_MEMBERS_FETCH rows before the blocking $group, so the
+            # group holds at most that many rows per guild ($setWindowFields needs MongoDB 5.0+).
+            # Rows leave the window stage in rank order, which $push keeps within each guild
+            pipeline = [
+                {'$match': {'guild_id': {'$in': guild_ids}, field: {'$gt': 0}}},
+                {'$setWindowFields': {
+                    'partitionBy': '$guild_id',
+                    'sortBy': {field: -1},
+                    'output': {'rank': {'$documentNumber': {}}}
+                }},
+                {'$match': {'rank': {'$lte': LeaderboardSettings.MAX_MEMBERS_FETCH}}},
+                {'$group': {'_id': '$guild_id', 'rows': {'$push': {'user_id': '$user_id', field: f'${field}'}}}}
+            ]
+            cursor = self.read_db.user_stats.aggregate(pipeline, hint=f'lb_{field}', allowDiskUse=True)
+            return {doc['_id']: doc['rows'] async for doc in cursor}
+        
+        result = {}
+        try:
+            # One aggregation per period, run concurrently - still independent of the guild count
+            ranked_by_period = dict(zip(periods, await asyncio.gather(*(_ranked(p) for p in periods))))
+        except Exception as e:
+            self.logger.error(f"Error bulk fetching voice leaderboards: {e}")
+            return {}
+        for period, ranked_by_guild in ranked_by_period.items():
+            field = PERIOD_FIELDS[period]
+            for guild_id, ranked in ranked_by_guild.items():
+                result.setdefault(guild_id, {})[period] = (
+                    ranked[:LeaderboardSettings.MEMBERS_PER_PAGE],
+                    ranked[0],
+                    sum(row[field] for row in ranked),
+                    len(ranked)
+                )
+        # Guilds without any ranked member still get (empty) data instead of a per-guild query
+        empty = ([], None, 0, 0)
+        for guild_id in guild_ids:
+            boards = result.setdefault(guild_id, {})
+            for period in periods:
+                boards.setdefault(period, empty)
+        return result
+    
+    async def _count_top_users(self, guild_id: int, period: str) -> int:
+        """Count ranked users for a period (capped at MAX_MEMBERS_FETCH) straight from the leaderboard index"""
+        try:
+            field = PERIOD_FIELDS.get(period, 'voice_weekly')
+            return await self.read_db.user_stats.count_documents(
+                {'guild_id': guild_id, field: {'$gt': 0}},
+                limit=LeaderboardSettings.MAX_MEMBERS_FETCH,
+                hint=f'lb_{field}'
+            )
+        except Exception as e:
+            self.logger.error(f"Error counting top users for guild {guild_id}, period {period}: {e}")
+            return 0
+    
     async def _get_last_month_winner(self, guild_id: int) -> Optional[Dict]:
-        """Get last month's top active member from archive"""
+        """Get last month's top active member from archive (cached until the next monthly reset)"""
+        cached = self._last_month_cache.get(guild_id)
+        if cached and time.time() < cached[0]:
+            return cached[1]
+        
         try:
-            # Find the most recent monthly archive for this guild
-            cursor = self.db.weekly_history.find({
-                'guild_id': guild_id,
-                'type': 'voice',
-                'period': 'monthly'
-            }).sort('reset_date', -1).limit(1)
-            
-            archives = await cursor.to_list(length=1)
-            if not archives:
-                return None
+            # Pick the top entry of the most recent monthly archive inside MongoDB
+            pipeline = [
+                {'$match': {'guild_id': guild_id, 'type': 'voice', 'period': 'monthly'}},
+                {'$sort': {'reset_date': -1}},
+                {'$limit': 1},
+                {'$unwind': '$stats'},
+                {'$sort': {'stats.voice_monthly': -1}},
+                {'$limit': 1},
+                # Ship only the winner's fields, already shaped like the return value
+                {'$project': {'_id': 0, 'user_id': '$stats.user_id', 'minutes': '$stats.voice_monthly', 'month': '$reset_date'}}
+            ]
+            winners = await self.read_db.weekly_history.aggregate(pipeline).to_list(length=1)
             
-            archive = archives[0]
-            stats = archive.get('stats', [])
+            winner = None
+            if winners and winners[0].get('minutes', 0) > 0:
+                winner = winners[0]
             
-            if not stats:
-                return None
-            
-            # Find the user with highest voice_monthly
-            top_user = max(stats, key=lambda x: x.get('voice_monthly', 0))
-            
-            if top_user.get('voice_monthly', 0) > 0:
-                return {
-                    'user_id': top_user['user_id'],
-                    'minutes': top_user['voice_monthly'],
-                    'month': archive['reset_date']
-                }
-            
-            return None
+            # The winner only changes on a monthly reset - cache until the next month starts (UTC)
+            now = datetime.utcnow()
+            next_month = datetime(now.year + 1, 1, 1) if now.month == 12 else datetime(now.year, now.month + 1, 1)
+            self._last_month_cache[guild_id] = (next_month.replace(tzinfo=pytz.UTC).timestamp(), winner)
+            return winner
         except Exception as e:
             self.logger.error(f"Error fetching last month winner for guild {guild_id}: {e}")
             return None
@@ -443,35 +844,20 @@ class VoiceLeaderboardCog(commands.Cog):
         )
     
     def _format_time(self, minutes: float) -> str:
-        """Format minutes into human-readable time string with validation"""
-        # Validate and sanitize input
-        if not isinstance(minutes, (int, float)):
-            self.logger.error(f"Invalid type for minutes: {type(minutes)}")
-            return "0m"
-        
-        if minutes < 0:
-            self.logger.warning(f"Negative time value received: {minutes}")
-            minutes = 0
-        elif minutes > self.max_session_duration * 30:  # Sanity check for display
-            self.logger.warning(f"Extremely large time value: {minutes}")
-            minutes = self.max_session_duration * 30
-        
-        # Round to avoid float display issues
-        minutes = round(minutes)
-        
-        if minutes < 60:
-            return f"{minutes}m"
-        hours = minutes // 60
-        mins = minutes % 60
+        """Format minutes into human-readable time string (values are pre-validated by _increment_voice_time)"""
+        m = max(0, round(minutes))
+        if m < 60:
+            return f"{m}m"
+        hours, mins = divmod(m, 60)
         if hours >= 24:
-            days = hours // 24
-            hours = hours % 24
-            if hours == 0:
-                return f"{days}d"
-            return f"{days}d {hours}h"
-        if mins == 0:
-            return f"{hours} hours"
-        return f"{hours}h {mins}m"
+            days, hours = divmod(hours, 24)
+            return f"{days}d {hours}h" if hours else f"{days}d"
+        return f"{hours}h {mins}m" if mins else f"{hours} hours"
+    
+    def _left_user_name(self, user_id: int) -> str:
+        """Stable placeholder name for users who left the server, e.g. UserB-123456"""
+        # A-Z based on ID - cheap to rebuild, so nothing is kept per user
+        return f"User{chr(65 + (user_id % 26))}-{str(user_id)[-6:]}"
     
     async def _build_all_embeds(self, guild_id: int, period: str, page: int = 0) -> List[discord.Embed]:
         """Build ALL embeds: header image + monthly + weekly + daily"""
@@ -486,61 +872,64 @@ class VoiceLeaderboardCog(commands.Cog):
         header_embed.set_image(url=Images.VOICE_HEADER)
         embeds.append(header_embed)
         
-        # Embeds 1-3: Monthly, Weekly, Daily
+        # Embeds 1-3: Monthly, Weekly, Daily (guild and timezone resolved once for all three)
+        tz = self._guild_tz(await self._get_guild_config(guild_id))
         periods = ['monthly', 'weekly', 'daily']
         for p in periods:
-            embed = await self._build_period_embed(guild_id, p, page)
+            embed = await self._build_period_embed(guild_id, p, page, guild=guild, tz=tz)
             embeds.append(embed)
         
         return embeds
     
-    async def _build_period_embed(self, guild_id: int, period: str, page: int) -> discord.Embed:
-        """Build a single period embed with dynamic data"""
-        guild = self.bot.get_guild(guild_id)
-        stats = await self._get_top_users(guild_id, period, limit=LeaderboardSettings.MAX_MEMBERS_FETCH)
+    def _guild_tz(self, config: Optional[Dict]):
+        """Resolve the timezone object for a guild config (UTC if unknown)"""
+        return _safe_tz(config.get('timezone', LeaderboardSettings.DEFAULT_TIMEZONE) if config else LeaderboardSettings.DEFAULT_TIMEZONE) or pytz.UTC
+    
+    async def _build_period_embed(self, guild_id: int, period: str, page: int,
+                                  guild: Optional[discord.Guild] = None, tz=None, data=None) -> discord.Embed:
+        """Build a single period embed with dynamic data (served from a short TTL cache when fresh)"""
+        cache_key = (period, page)
+        cached = self._embed_cache.get(guild_id, {}).get(cache_key)
+        if cached and time.monotonic() - cached[0] < self._embed_cache_ttl:
+            return cached[1].copy()
         
+        if guild is None:
+            guild = self.bot.get_guild(guild_id)
         start_idx = page * LeaderboardSettings.MEMBERS_PER_PAGE
-        end_idx = start_idx + LeaderboardSettings.MEMBERS_PER_PAGE
-        page_stats = stats[start_idx:end_idx]
-        total_minutes = sum(s.get(f'voice_{period}', 0) for s in stats)
+        if data is None:
+            data = await self._get_page_and_totals(guild_id, period, page)
+        page_stats, top_stat, total_minutes, total_count = data
         total_hours = int(total_minutes // 60)
         
         # Build leaderboard lines
-        leaderboard_lines = []
-        for idx, user_stat in enumerate(page_stats, start=start_idx + 1):
-            user = guild.get_member(user_stat['user_id'])
-            if user:
-                username = user.display_name
-            else:
-                # For users who left the server, use consistent hash format
-                user_id_str = str(user_stat['user_id'])
-                hash_char = chr(65 + (user_stat['user_id'] % 26))  # A-Z based on ID
-                username = f"User{hash_char}-{user_id_str[-6:]}"  # e.g., UserB-123456
-            minutes = user_stat.get(f'voice_{period}', 0)
-            time_str = self._format_time(minutes)
+        # Resolve names and times in one pass each, then the row loop only formats strings
+        field = f'voice_{period}'
+        ids = [user_stat['user_id'] for user_stat in page_stats]
+        minutes_arr = [user_stat.get(field, 0) for user_stat in page_stats]
+        members = [guild.get_member(user_id) for user_id in ids]
+        names = [member.display_name if member else self._left_user_name(user_id) for member, user_id in zip(members, ids)]
+        leaderboard_lines = [
             # Truncate long usernames
-            if len(username) > 20:
-                username = username[:17] + "..."
-            leaderboard_lines.append(f"- `{idx:02d}` | `{username}` {Emojis.ARROW} `{time_str}`")
+            ROW_FMT.format(
+                idx=idx,
+                username=username if len(username) <= 20 else username[:17] + "...",
+                time=self._format_time(minutes)
+            )
+            for idx, username, minutes in zip(range(start_idx + 1, start_idx + 1 + len(ids)), names, minutes_arr)
+        ]
         
         leaderboard_text = "\n".join(leaderboard_lines) if leaderboard_lines else "No data yet"
         
         # Top user
         top_user_name = "No one yet"
         top_user_time = "0m"
-        if stats:
-            top_user = guild.get_member(stats[0]['user_id'])
-            if top_user:
-                top_user_name = top_user.display_name
-            else:
-                # For users who left the server, use consistent hash format
-                user_id_str = str(stats[0]['user_id'])
-                hash_char = chr(65 + (stats[0]['user_id'] % 26))
-                top_user_name = f"User{hash_char}-{user_id_str[-6:]}"
+        if top_stat:
+            top_user = guild.get_member(top_stat['user_id'])
+            top_user_name = top_user.display_name if top_user else self._left_user_name(top_stat['user_id'])
             # Truncate long names
             if len(top_user_name) > 20:
                 top_user_name = top_user_name[:17] + "..."
-            top_user_minutes = stats[0].get(f'voice_{period}', 0)
+            top_user_minutes = top_stat.get(f'voice_{period}', 0)
             top_user_time = self._format_time(top_user_minutes)
         
         # Period display
@@ -549,12 +938,9 @@ class VoiceLeaderboardCog(commands.Cog):
         else:
             period_display = PeriodConfig.PERIOD_DISPLAY_NAMES.get(period, 'Unknown')
         
-        period_title = PeriodConfig.VOICE_TITLES.get(period, 'Rankings')
-        subtitle = PeriodConfig.VOICE_SUBTITLES.get(period, 'Most active voice members are here!')
-        
         # Next reset time
-        config = await self._get_guild_config(guild_id)
-        tz = pytz.timezone(config.get('timezone', LeaderboardSettings.DEFAULT_TIMEZONE) if config else LeaderboardSettings.DEFAULT_TIMEZONE)
+        if tz is None:
+            tz = self._guild_tz(await self._get_guild_config(guild_id))
         now = datetime.now(tz)
         
         if period == 'daily':
@@ -582,13 +968,7 @@ class VoiceLeaderboardCog(commands.Cog):
             last_month_data = await self._get_last_month_winner(guild_id)
             if last_month_data:
                 winner_member = guild.get_member(last_month_data['user_id'])
-                if winner_member:
-                    winner_name = winner_member.display_name
-                else:
-                    # User left, use hash format
-                    user_id_str = str(last_month_data['user_id'])
-                    hash_char = chr(65 + (last_month_data['user_id'] % 26))
-                    winner_name = f"User{hash_char}-{user_id_str[-6:]}"
+                winner_name = winner_member.display_name if winner_member else self._left_user_name(last_month_data['user_id'])
                 
                 # Format time
                 minutes = last_month_data['minutes']
@@ -604,16 +984,13 @@ class VoiceLeaderboardCog(commands.Cog):
                 last_month_winner_text = f"`{winner_name}` with `{time_str}` in {month_name}"
         
         # Build description using config template
-        description = VoiceTemplates.build_description(
-            period_title=period_title,
+        description = self._desc_builders[period](
             total_hours=total_hours,
             period_display=period_display,
             top_user_name=top_user_name,
             top_user_time=top_user_time,
             leaderboard_text=leaderboard_text,
             reset_timestamp=reset_timestamp,
-            subtitle=subtitle,
-            period=period,
             last_month_winner=last_month_winner_text
         )
         
@@ -622,17 +999,33 @@ class VoiceLeaderboardCog(commands.Cog):
         
         # Footer
         footer_text = VoiceTemplates.FOOTER_TEXT
-        if len(stats) > LeaderboardSettings.MEMBERS_PER_PAGE:
-            total_pages = (len(stats) - 1) // LeaderboardSettings.MEMBERS_PER_PAGE + 1
+        if total_count > LeaderboardSettings.MEMBERS_PER_PAGE:
+            total_pages = (total_count - 1) // LeaderboardSettings.MEMBERS_PER_PAGE + 1
             footer_text = f"Page {page + 1}/{total_pages} • {footer_text}"
         embed.set_footer(text=footer_text, icon_url=Images.FOOTER_ICON)
         
         # Divider image
         embed.set_image(url=Images.DIVIDER)
         
+        self._embed_cache.setdefault(guild_id, {})[cache_key] = (time.monotonic(), embed.copy())
         return embed
     
-    async def _create_full_leaderboard_message(self, channel: discord.TextChannel, guild_id: int, vibe_channel_id: int = None):
+    def _invalidate_embed_cache(self, guild_id: int):
+        """Drop cached embeds for a guild after its stats change"""
+        self._embed_cache.pop(guild_id, None)
+        self._dirty_guilds.add(guild_id)
+    
+    @staticmethod
+    def _embed_hash(embed: discord.Embed) -> int:
+        """Hash of the parts of a leaderboard embed that change between updates"""
+        return hash((embed.description, embed.footer.text))
+    
+    def _forget_embed_hashes(self, guild_id: int):
+        """Force the next update to edit every leaderboard message of a guild"""
+        for period in ('daily', 'weekly', 'monthly'):
+            self._last_embed_hash.pop((guild_id, period), None)
+    
+    async def _create_full_leaderboard_message(self, channel: discord.TextChannel, guild_id: int, vibe_channel_id: int = None, tz=None):
         """Create separate leaderboard messages for each period with individual buttons"""
         try:
             # Clear old cached views since we're creating new messages
@@ -640,6 +1033,19 @@ class VoiceLeaderboardCog(commands.Cog):
                 cache_key = (guild_id, period)
                 if cache_key in self.view_cache:
                     del self.view_cache[cache_key]
+            self._forget_embed_hashes(guild_id)
+            self._msg_cache.pop(guild_id, None)
+            
+            # Resolve the timezone once for all three period embeds
+            if tz is None:
+                tz = self._guild_tz(await self._get_guild_config(guild_id))
+            
+            # Build the three period embeds concurrently; the sends below stay sequential
+            # because concurrent sends would not keep the header/monthly/weekly/daily order
+            monthly_embed, weekly_embed, daily_embed = await asyncio.gather(*(
+                self._build_period_embed(guild_id, period, page=0, guild=channel.guild, tz=tz)
+                for period in ('monthly', 'weekly', 'daily')
+            ))
             
             # Send header image
             header_embed = discord.Embed(color=EMBED_COLOR)
@@ -647,25 +1053,25 @@ class VoiceLeaderboardCog(commands.Cog):
             await channel.send(embed=header_embed)
             
             # Send monthly embed with Join the Vibe button
-            monthly_embed = await self._build_period_embed(guild_id, 'monthly', page=0)
             monthly_view = VoiceLeaderboardPaginator(self, guild_id, 'monthly', page=0, vibe_channel_id=vibe_channel_id)
             monthly_message = await channel.send(embed=monthly_embed, view=monthly_view)
             self.view_cache[(guild_id, 'monthly')] = monthly_view
             
             # Send weekly embed with Join the Vibe button
-            weekly_embed = await self._build_period_embed(guild_id, 'weekly', page=0)
             weekly_view = VoiceLeaderboardPaginator(self, guild_id, 'weekly', page=0, vibe_channel_id=vibe_channel_id)
             weekly_message = await channel.send(embed=weekly_embed, view=weekly_view)
             self.view_cache[(guild_id, 'weekly')] = weekly_view
             
             # Send daily embed with pagination buttons
-            daily_embed = await self._build_period_embed(guild_id, 'daily', page=0)
             daily_view = VoiceLeaderboardPaginator(self, guild_id, 'daily', page=0, vibe_channel_id=vibe_channel_id)
             daily_message = await channel.send(embed=daily_embed, view=daily_view)
             self.view_cache[(guild_id, 'daily')] = daily_view
             
             # Save ALL message IDs for updates
             await self._save_leaderboard_messages(guild_id, channel.id, daily_message.id, weekly_message.id, monthly_message.id)
+            self._msg_cache[guild_id] = tuple(
+                channel.get_partial_message(m.id) for m in (daily_message, weekly_message, monthly_message)
+            )
             self.logger.info(f"Created voice leaderboard messages for guild {guild_id}")
         except Exception as e:
             self.logger.error(f"Failed to create leaderboard for guild {guild_id}: {e}", exc_info=True)
@@ -676,393 +1082,404 @@ class VoiceLeaderboardCog(commands.Cog):
         # Filter bots immediately
         if member.bot:
             return
+        # Mute/deafen/stream/video toggles keep the channel - nothing to track, skip the config read too
+        if before.channel == after.channel:
+            return
         
+        flush_queue = False
         try:
-            config = await self._get_guild_config(member.guild.id)
-            if not config or not config.get('voice_enabled'):
-                return
-            
-            guild_id = member.guild.id
-            user_id = member.id
-            session_key = (guild_id, user_id)
-            current_time = datetime.utcnow()
-            
-            # Clean up old sessions periodically (memory leak prevention)
-            if len(self.voice_sessions) > 1000:
-                await self._cleanup_stale_sessions()
-            
-            # Determine if channels are AFK
-            afk_channel_id = member.guild.afk_channel.id if member.guild.afk_channel else None
-            before_is_afk = before.channel and afk_channel_id and before.channel.id == afk_channel_id
-            after_is_afk = after.channel and afk_channel_id and after.channel.id == afk_channel_id
-            
-            async with self.voice_sessions_lock:
+            # Per-member lock: events for the same member are handled in arrival order even
+            # though the config read yields, while unrelated members never wait on each other
+            async with self._session_locks.lock((member.guild.id, member.id)):
+                config = await self._get_guild_config(member.guild.id)
+                if not config or not config.get('voice_enabled'):
+                    return
+                
+                guild_id = member.guild.id
+                user_id = member.id
+                session_key = (guild_id, user_id)
+                current_time = datetime.utcnow()
+                
+                # Determine if channels are AFK
+                afk_channel_id = self._afk_id(member.guild)
+                before_is_afk = before.channel and afk_channel_id and before.channel.id == afk_channel_id
+                after_is_afk = after.channel and afk_channel_id and after.channel.id == afk_channel_id
+                
                 # User joined a voice channel (not AFK)
                 if before.channel is None and after.channel is not None and not after_is_afk:
-                    self.voice_sessions[session_key] = current_time
+                    self._start_session(session_key, current_time)
                     self.logger.debug(f"Voice session started: {member.display_name} in guild {guild_id}")
                 
                 # User left a voice channel (not from AFK)
                 elif before.channel is not None and after.channel is None and not before_is_afk:
-                    if session_key in self.voice_sessions:
-                        joined_at = self.voice_sessions.pop(session_key, None)
-                        if joined_at and isinstance(joined_at, datetime):
-                            minutes = (current_time - joined_at).total_seconds() / 60
-                            if 0 < minutes < self.max_session_duration:  # Validate reasonable time
-                                # Queue the save instead of immediate write
-                                self.session_save_queue[session_key] = minutes
-                                # Process queue if it gets too large
-                                if len(self.session_save_queue) >= 10:
-                                    await self._process_save_queue()
-                            elif minutes >= self.max_session_duration:
-                                self.logger.warning(f"Session exceeded max duration for {member.display_name}: {minutes:.1f} minutes")
-                                await self._increment_voice_time(guild_id, user_id, self.max_session_duration)
+                    flush_queue = await self._finalize_session(session_key, current_time)
                 
                 # User moved between channels
                 elif before.channel != after.channel and before.channel is not None and after.channel is not None:
                     # Moving to AFK from active channel
                     if not before_is_afk and after_is_afk:
-                        if session_key in self.voice_sessions:
-                            joined_at = self.voice_sessions.pop(session_key, None)
-                            if joined_at and isinstance(joined_at, datetime):
-                                minutes = (current_time - joined_at).total_seconds() / 60
-                                if 0 < minutes < self.max_session_duration:
-                                    self.session_save_queue[session_key] = minutes
-                                    if len(self.session_save_queue) >= 10:
-                                        await self._process_save_queue()
+                        flush_queue = await self._finalize_session(session_key, current_time)
                     
                     # Moving from AFK to active channel
                     elif before_is_afk and not after_is_afk:
-                        self.voice_sessions[session_key] = current_time
+                        self._start_session(session_key, current_time)
                         self.logger.debug(f"Moved from AFK: {member.display_name}")
                     
                     # Moving between active channels (keep session alive)
                     elif not before_is_afk and not after_is_afk:
                         # Validate existing session
                         if session_key not in self.voice_sessions:
-                            self.voice_sessions[session_key] = current_time
+                            self._start_session(session_key, current_time)
                             self.logger.debug(f"Session missing, started new: {member.display_name}")
+            
+            # The global lock is only needed around the save-queue flush
+            if flush_queue:
+                async with self.voice_sessions_lock:
+                    await self._process_save_queue()
         except Exception as e:
             self.logger.error(f"Error in voice state update for {member.id}: {e}", exc_info=True)
     
-    @tasks.loop(minutes=5)
-    async def update_leaderboards(self):
+    @tasks.loop(minutes=5)  # Check every 5 minutes for zero chance of missing a reset
+    async def unified_tick(self):
+        """Single 5-minute sweep: resets, then refreshes of changed guilds (every guild hourly)"""
         try:
-            cursor = self.db.guild_configs.find({'voice_enabled': True})
-            configs = await cursor.to_list(length=1000)
-            for config in configs:
+            # Make sure coalesced voice time is visible in this tick
+            await self._flush_pending_inc()
+            # Only guilds whose stats changed get their messages refreshed, plus an hourly full sweep
+            full_sweep = time.monotonic() - self._last_full_sweep >= self._full_sweep_interval
+            if full_sweep:
+                self._last_full_sweep = time.monotonic()
+            cursor = self.db.guild_configs.find({'voice_enabled': True}, projection=TICK_CONFIG_PROJECTION)
+            now_by_tz = {}  # Guilds sharing a timezone share one datetime.now() per tick
+            # Guilds are processed concurrently, bounded so a slow guild or REST hiccup
+            # no longer stalls the whole tick without flooding Mongo or Discord
+            sem = asyncio.Semaphore(self.tick_concurrency)
+            
+            async def _reset_guild(config, tz, now):
+                async with sem:
+                    await self._maybe_daily_reset(config, now)
+                    await self._maybe_weekly_reset(config, now)
+                    await self._maybe_monthly_reset(config, tz, now)
+            
+            async def _refresh_guild(config, tz, guild_boards):
+                async with sem:
+                    await self._refresh_leaderboard(config, tz, guild_boards)
+            
+            guilds = []
+            async for config in cursor:
                 guild_id = config['guild_id']
-                guild = self.bot.get_guild(guild_id)
-                if not guild:
-                    continue
-                try:
-                    msg_data = await self._get_leaderboard_message(guild_id)
-                    vibe_channel_id = config.get('vibe_channel_id')
-                    
-                    # If no message data exists, try to create messages if channel is configured
-                    if not msg_data:
-                        voice_channel_id = config.get('voice_channel_id')
-                        if voice_channel_id:
-                            channel = guild.get_channel(voice_channel_id)
-                            if channel:
-                                self.logger.info(f"No leaderboard messages found for guild {guild_id}, creating...")
-                                await self._create_full_leaderboard_message(channel, guild_id, vibe_channel_id)
-                        continue
-                    
-                    channel = guild.get_channel(msg_data['channel_id'])
-                    if not channel:
-                        # Channel was deleted, clean up database reference
-                        self.logger.warning(f"Voice leaderboard channel {msg_data['channel_id']} not found for guild {guild_id}, cleaning up")
-                        await self.db.leaderboard_messages.delete_one({'guild_id': guild_id, 'type': 'voice'})
-                        continue
-                    
-                    # Get message IDs (support both old and new format)
-                    daily_id = msg_data.get('daily_message_id') or msg_data.get('message_id')
-                    weekly_id = msg_data.get('weekly_message_id')
-                    monthly_id = msg_data.get('monthly_message_id')
-                    
-                    self.logger.debug(f"Guild {guild_id} - Message IDs: daily={daily_id}, weekly={weekly_id}, monthly={monthly_id}")
-                    
-                    messages_missing = False
-                    
-                    # Update all three messages
-                    try:
-                        # Update daily message
-                        if daily_id:
-                            try:
-                                self.logger.debug(f"Fetching daily message {daily_id} for guild {guild_id}")
-                                daily_message = await channel.fetch_message(daily_id)
-                                self.logger.debug(f"Successfully fetched daily message {daily_id}")
-                                if daily_message.author.id == self.bot.user.id:
-                                    # Get or create cached view to preserve page state
-                                    cache_key = (guild_id, 'daily')
-                                    if cache_key not in self.view_cache:
-                                        self.view_cache[cache_key] = VoiceLeaderboardPaginator(self, guild_id, 'daily', page=0, vibe_channel_id=vibe_channel_id)
-                                    daily_view = self.view_cache[cache_key]
-                                    # Build embed with current page from cached view
-                                    daily_embed = await self._build_period_embed(guild_id, 'daily', page=daily_view.page)
-                                    await daily_message.edit(embed=daily_embed, view=daily_view)
-                                    self.logger.debug(f"Updated daily voice leaderboard for guild {guild_id}")
-                                else:
-                                    self.logger.warning(f"Daily message {daily_id} not owned by bot for guild {guild_id}")
-                                    messages_missing = True
-                            except discord.NotFound:
-                                self.logger.warning(f"Daily message {daily_id} not found for guild {guild_id}")
-                                messages_missing = True
-                            except Exception as e:
-                                self.logger.error(f"Error updating daily message for guild {guild_id}: {e}")
-                                messages_missing = True
-                        else:
-                            self.logger.warning(f"No daily_id found for guild {guild_id}")
-                            messages_missing = True
-                        
-                        # Update weekly message
-                        if weekly_id:
-                            try:
-                                self.logger.debug(f"Fetching weekly message {weekly_id} for guild {guild_id}")
-                                weekly_message = await channel.fetch_message(weekly_id)
-                                self.logger.debug(f"Successfully fetched weekly message {weekly_id}")
-                                if weekly_message.author.id == self.bot.user.id:
-                                    # Get or create cached view
-                                    cache_key = (guild_id, 'weekly')
-                                    if cache_key not in self.view_cache:
-                                        self.view_cache[cache_key] = VoiceLeaderboardPaginator(self, guild_id, 'weekly', page=0, vibe_channel_id=vibe_channel_id)
-                                    weekly_view = self.view_cache[cache_key]
-                                    weekly_embed = await self._build_period_embed(guild_id, 'weekly', page=0)
-                                    await weekly_message.edit(embed=weekly_embed, view=weekly_view)
-                                    self.logger.debug(f"Updated weekly voice leaderboard for guild {guild_id}")
-                                else:
-                                    self.logger.warning(f"Weekly message {weekly_id} not owned by bot for guild {guild_id}")
-                                    messages_missing = True
-                            except discord.NotFound:
-                                self.logger.warning(f"Weekly message {weekly_id} not found for guild {guild_id}")
-                                messages_missing = True
-                            except Exception as e:
-                                self.logger.error(f"Error updating weekly message for guild {guild_id}: {e}")
-                                messages_missing = True
-                        else:
-                            self.logger.warning(f"No weekly_id found for guild {guild_id}")
-                            messages_missing = True
-                        
-                        # Update monthly message
-                        if monthly_id:
-                            try:
-                                self.logger.debug(f"Fetching monthly message {monthly_id} for guild {guild_id}")
-                                monthly_message = await channel.fetch_message(monthly_id)
-                                self.logger.debug(f"Successfully fetched monthly message {monthly_id}")
-                                if monthly_message.author.id == self.bot.user.id:
-                                    # Get or create cached view
-                                    cache_key = (guild_id, 'monthly')
-                                    if cache_key not in self.view_cache:
-                                        self.view_cache[cache_key] = VoiceLeaderboardPaginator(self, guild_id, 'monthly', page=0, vibe_channel_id=vibe_channel_id)
-                                    monthly_view = self.view_cache[cache_key]
-                                    monthly_embed = await self._build_period_embed(guild_id, 'monthly', page=0)
-                                    await monthly_message.edit(embed=monthly_embed, view=monthly_view)
-                                    self.logger.debug(f"Updated monthly voice leaderboard for guild {guild_id}")
-                                else:
-                                    self.logger.warning(f"Monthly message {monthly_id} not owned by bot for guild {guild_id}")
-                                    messages_missing = True
-                            except discord.NotFound:
-                                self.logger.warning(f"Monthly message {monthly_id} not found for guild {guild_id}")
-                                messages_missing = True
-                            except Exception as e:
-                                self.logger.error(f"Error updating monthly message for guild {guild_id}: {e}")
-                                messages_missing = True
-                        else:
-                            self.logger.warning(f"No monthly_id found for guild {guild_id}")
-                            messages_missing = True
-                        
-                        # If any messages are missing, recreate all
-                        if messages_missing:
-                            self.logger.info(f"Voice leaderboard messages missing or invalid for guild {guild_id}, recreating all embeds")
-                            await self.db.leaderboard_messages.delete_one({'guild_id': guild_id, 'type': 'voice'})
-                            await self._create_full_leaderboard_message(channel, guild_id, vibe_channel_id)
-                        else:
-                            self.logger.info(f"Successfully updated all voice leaderboards for guild {guild_id}")
-                            
-                    except discord.Forbidden as e:
-                        self.logger.error(
-                            f"Permission denied editing message for guild {guild_id}: {e}. "
-                            f"Removing invalid reference and recreating."
-                        )
-                        await self.db.leaderboard_messages.delete_one({'guild_id': guild_id, 'type': 'voice'})
-                        await self._create_full_leaderboard_message(channel, guild_id, vibe_channel_id)
-                    except discord.HTTPException as e:
-                        self.logger.error(f"HTTP error updating voice leaderboard for guild {guild_id}: {e}")
-                except Exception as e:
-                    self.logger.error(f"Error updating voice leaderboard for guild {guild_id}: {e}", exc_info=True)
+                tz_name = config.get('timezone', 'UTC')
+                tz = _safe_tz(tz_name)
+                if tz is None:
+                    self.logger.warning(f"Invalid timezone '{tz_name}' for guild {guild_id}, using UTC")
+                    tz = pytz.UTC
+                now = now_by_tz.get(tz.zone)
+                if now is None:
+                    now = now_by_tz[tz.zone] = datetime.now(tz)
+                guilds.append((config, tz, now))
+            
+            results = await asyncio.gather(*(_reset_guild(*guild) for guild in guilds), return_exceptions=True)
+            self._log_tick_errors(guilds, results, 'reset')
+            
+            # Resets above mark their guild dirty, so read the set only now
+            refresh = []
+            for config, tz, _ in guilds:
+                guild_id = config['guild_id']
+                if full_sweep or guild_id in self._dirty_guilds:
+                    # A failed refresh marks the guild dirty again for the next tick
+                    self._dirty_guilds.discard(guild_id)
+                    refresh.append((config, tz))
+            
+            # Read every guild's leaderboards after the resets, in one aggregation per period
+            boards = await self._bulk_leaderboards([config['guild_id'] for config, _ in refresh])
+            results = await asyncio.gather(
+                *(_refresh_guild(config, tz, boards.get(config['guild_id'])) for config, tz in refresh),
+                return_exceptions=True
+            )
+            self._log_tick_errors(refresh, results, 'refresh')
         except Exception as e:
-            self.logger.error(f"Error in update_leaderboards task: {e}", exc_info=True)
+            self.logger.error(f"Error in unified_tick task: {e}", exc_info=True)
+    
+    def _log_tick_errors(self, guilds: List, results: List, stage: str):
+        """Log per-guild exceptions returned by a gathered tick stage"""
+        for guild, result in zip(guilds, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in unified_tick {stage} for guild {guild[0]['guild_id']}: {result}", exc_info=result)
     
-    @update_leaderboards.before_loop
-    async def before_update_leaderboards(self):
+    @unified_tick.before_loop
+    async def before_unified_tick(self):
         await self.bot.wait_until_ready()
         # Initialize voice sessions after bot is ready
         await self._initialize_voice_sessions()
     
-    @tasks.loop(minutes=5)  # Check every 5 minutes for zero chance of missing
-    async def weekly_reset(self):
+    async def _refresh_leaderboard(self, config: Dict, tz, boards: Optional[Dict] = None):
+        """Edit (or recreate) the three leaderboard messages of a guild from prefetched boards"""
+        boards = boards or {}
+        guild_id = config['guild_id']
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
+            return
+        try:
+            msg_data = await self._get_leaderboard_message(guild_id)
+            vibe_channel_id = config.get('vibe_channel_id')
+            
+            # If no message data exists, try to create messages if channel is configured
+            if not msg_data:
+                voice_channel_id = config.get('voice_channel_id')
+                if voice_channel_id:
+                    channel = guild.get_channel(voice_channel_id)
+                    if channel:
+                        self.logger.info(f"No leaderboard messages found for guild {guild_id}, creating...")
+                        await self._create_full_leaderboard_message(channel, guild_id, vibe_channel_id, tz=tz)
+                return
+            
+            channel = guild.get_channel(msg_data['channel_id'])
+            if not channel:
+                # Channel was deleted, clean up database reference
+                self.logger.warning(f"Voice leaderboard channel {msg_data['channel_id']} not found for guild {guild_id}, cleaning up")
+                self._msg_cache.pop(guild_id, None)
+                await self.db.leaderboard_messages.delete_one({'guild_id': guild_id, 'type': 'voice'})
+                return
+            
+            # Get message IDs (support both old and new format)
+            daily_id = msg_data.get('daily_message_id') or msg_data.get('message_id')
+            weekly_id = msg_data.get('weekly_message_id')
+            monthly_id = msg_data.get('monthly_message_id')
+            
+            self.logger.debug(f"Guild {guild_id} - Message IDs: daily={daily_id}, weekly={weekly_id}, monthly={monthly_id}")
+            
+            # Edit through PartialMessages: the bot created these messages, so there is
+            # no need to GET them first - a deleted one surfaces as NotFound on the PATCH
+            partials = self._msg_cache.get(guild_id)
+            if (
+                partials is None
+                or partials[0].channel.id != channel.id
+                or tuple(m.id for m in partials) != (daily_id, weekly_id, monthly_id)
+            ):
+                partials = tuple(channel.get_partial_message(mid) if mid else None for mid in (daily_id, weekly_id, monthly_id))
+                if all(partials):
+                    self._msg_cache[guild_id] = partials
+            daily_message, weekly_message, monthly_message = partials
+            
+            # Update all three messages concurrently - each reports whether its message is usable
+            try:
+                results = await asyncio.gather(
+                    self._refresh_period_message(guild, 'daily', daily_message, daily_id, vibe_channel_id, tz, boards),
+                    self._refresh_period_message(guild, 'weekly', weekly_message, weekly_id, vibe_channel_id, tz, boards),
+                    self._refresh_period_message(guild, 'monthly', monthly_message, monthly_id, vibe_channel_id, tz, boards)
+                )
+                messages_missing = not all(results)
+                
+                # If any messages are missing, recreate all
+                if messages_missing:
+                    self.logger.info(f"Voice leaderboard messages missing or invalid for guild {guild_id}, recreating all embeds")
+                    await self.db.leaderboard_messages.delete_one({'guild_id': guild_id, 'type': 'voice'})
+                    await self._create_full_leaderboard_message(channel, guild_id, vibe_channel_id, tz=tz)
+                else:
+                    self.logger.info(f"Successfully updated all voice leaderboards for guild {guild_id}")
+            
+            except discord.Forbidden as e:
+                self.logger.error(
+                    f"Permission denied editing message for guild {guild_id}: {e}. "
+                    f"Removing invalid reference and recreating."
+                )
+                await self.db.leaderboard_messages.delete_one({'guild_id': guild_id, 'type': 'voice'})
+                await self._create_full_leaderboard_message(channel, guild_id, vibe_channel_id, tz=tz)
+            except discord.HTTPException as e:
+                self.logger.error(f"HTTP error updating voice leaderboard for guild {guild_id}: {e}")
+                self._dirty_guilds.add(guild_id)
+        except Exception as e:
+            self.logger.error(f"Error updating voice leaderboard for guild {guild_id}: {e}", exc_info=True)
+            self._dirty_guilds.add(guild_id)
+    
+    async def _refresh_period_message(self, guild: discord.Guild, period: str, message, message_id,
+                                      vibe_channel_id, tz, boards: Dict) -> bool:
+        """Edit one period's leaderboard message; False when it is missing or unusable"""
+        guild_id = guild.id
+        if not message_id:
+            self.logger.warning(f"No {period}_id found for guild {guild_id}")
+            return False
+        try:
+            # Get or create cached view to preserve page state
+            cache_key = (guild_id, period)
+            new_view = cache_key not in self.view_cache
+            if new_view:
+                self.view_cache[cache_key] = VoiceLeaderboardPaginator(self, guild_id, period, page=0, vibe_channel_id=vibe_channel_id)
+            view = self.view_cache[cache_key]
+            # Only the daily board paginates; prefetched data covers page 0
+            page = view.page if period == 'daily' else 0
+            embed = await self._build_period_embed(
+                guild_id, period, page=page, guild=guild, tz=tz,
+                data=boards.get(period) if page == 0 else None
+            )
+            # Skip the edit when the rendered content is identical
+            embed_hash = self._embed_hash(embed)
+            if self._last_embed_hash.get(cache_key) != embed_hash:
+                # The message keeps its registered view; attach only one built by this process
+                if new_view:
+                    await message.edit(embed=embed, view=view)
+                else:
+                    await message.edit(embed=embed)
+                self._last_embed_hash[cache_key] = embed_hash
+                self.logger.debug(f"Updated {period} voice leaderboard for guild {guild_id}")
+            return True
+        except discord.NotFound:
+            self.logger.warning(f"{period.capitalize()} message {message_id} not found for guild {guild_id}")
+        except Exception as e:
+            self.logger.error(f"Error updating {period} message for guild {guild_id}: {e}")
+        return False
+    
+    async def _maybe_weekly_reset(self, config: Dict, now: datetime):
         """Check for weekly reset with missed reset detection
         
         NOTE: If Star of the Week system is configured, it handles weekly resets.
-        This task only runs for guilds without Star system or as a backup.
+        This check only runs for guilds without Star system or as a backup.
         """
+        guild_id = config['guild_id']
         try:
-            cursor = self.db.guild_configs.find({'voice_enabled': True})
-            configs = await cursor.to_list(length=1000)
-            for config in configs:
-                guild_id = config['guild_id']
-                
-                # Check if Star of the Week system is managing resets for this guild
-                star_config = await self.db.star_configs.find_one({'guild_id': guild_id})
-                if star_config:
-                    # Star system is configured - it will handle weekly resets
-                    self.logger.debug(f"Star system manages weekly resets for guild {guild_id}, skipping")
-                    continue
-                
-                tz_name = config.get('timezone', 'UTC')
-                try:
-                    # Validate timezone
-                    if tz_name not in pytz.all_timezones:
-                        self.logger.warning(f"Invalid timezone '{tz_name}' for guild {guild_id}, using UTC")
-                        tz_name = 'UTC'
-                    tz = pytz.timezone(tz_name)
-                    now = datetime.now(tz)
-                    
-                    # Multiple checks to NEVER miss weekly reset
-                    last_reset_time = config.get('last_voice_weekly_reset')
-                    should_reset = False
-                    
-                    if last_reset_time:
-                        hours_since = (datetime.utcnow() - last_reset_time).total_seconds() / 3600
-                        days_since = hours_since / 24
-                        
-                        # Check 1: Has it been at least 6.5 days?
-                        if days_since >= 6.5:
-                            if now.weekday() == 6 and now.hour >= 12:  # Sunday noon or later
-                                should_reset = True
-                                self.logger.info(f"Voice weekly reset for guild {guild_id}: {days_since:.1f} days since last")
-                            elif now.weekday() == 0:  # Monday (missed Sunday)
-                                should_reset = True
-                                self.logger.warning(f"Missed Sunday voice reset for guild {guild_id}, doing it now")
-                            elif days_since >= 7.0:  # Full week passed
-                                should_reset = True
-                                self.logger.warning(f"Full week passed for voice guild {guild_id}: {days_since:.1f} days")
-                    else:
-                        # Never reset before - do it now if enabled
-                        if config.get('voice_enabled'):
-                            should_reset = True
-                            self.logger.info(f"First voice weekly reset for guild {guild_id}")
-                    
-                    if should_reset:
-                        await self._reset_weekly_stats(guild_id)
-                        # Persist reset time to database
-                        await self.db.guild_configs.update_one(
-                            {'guild_id': guild_id},
-                            {'$set': {'last_voice_weekly_reset': datetime.utcnow()}}
-                        )
-                        self.last_weekly_reset[guild_id] = now
+            # Multiple checks to NEVER miss weekly reset - all from the config already in hand
+            last_reset_time = config.get('last_voice_weekly_reset')
+            reset_reason = None
+            
+            if last_reset_time:
+                hours_since = (datetime.utcnow() - last_reset_time).total_seconds() / 3600
+                days_since = hours_since / 24
                 
-                except pytz.exceptions.UnknownTimeZoneError:
-                    self.logger.error(f"Invalid timezone for guild {guild_id}: {tz_name}")
-                except Exception as e:
-                    self.logger.error(f"Error checking weekly reset for guild {guild_id}: {e}", exc_info=True)
+                # Check 1: Has it been at least 6.5 days?
+                if days_since >= 6.5:
+                    if now.weekday() == 6 and now.hour >= 12:  # Sunday noon or later
+                        reset_reason = (logging.INFO, f"Voice weekly reset for guild {guild_id}: {days_since:.1f} days since last")
+                    elif now.weekday() == 0:  # Monday (missed Sunday)
+                        reset_reason = (logging.WARNING, f"Missed Sunday voice reset for guild {guild_id}, doing it now")
+                    elif days_since >= 7.0:  # Full week passed
+                        reset_reason = (logging.WARNING, f"Full week passed for voice guild {guild_id}: {days_since:.1f} days")
+            else:
+                # Never reset before - do it now if enabled
+                if config.get('voice_enabled'):
+                    reset_reason = (logging.INFO, f"First voice weekly reset for guild {guild_id}")
+            
+            if not reset_reason:
+                return
+            
+            # Only now hit star_configs - most ticks never get this far
+            star_config = await self.db.star_configs.find_one({'guild_id': guild_id}, {'_id': 1})
+            if star_config:
+                # Star system is configured - it will handle weekly resets
+                self.logger.debug(f"Star system manages weekly resets for guild {guild_id}, skipping")
+                return
+            
+            # Claim the reset before doing it so a concurrent tick cannot reset twice
+            if not await self._claim_reset(guild_id, 'last_voice_weekly_reset', datetime.utcnow() - timedelta(days=6.5)):
+                return
+            self.logger.log(*reset_reason)
+            await self._reset_weekly_stats(guild_id)
+            self.last_weekly_reset[guild_id] = now
         except Exception as e:
-            self.logger.error(f"Error in weekly_reset task: {e}", exc_info=True)
+            self.logger.error(f"Error checking weekly reset for guild {guild_id}: {e}", exc_info=True)
     
-    @weekly_reset.before_loop
-    async def before_weekly_reset(self):
-        await self.bot.wait_until_ready()
-    
-    @tasks.loop(minutes=5)  # Check every 5 minutes
-    async def daily_reset(self):
+    async def _maybe_daily_reset(self, config: Dict, now: datetime):
         """Check for daily reset (midnight guild time)"""
+        guild_id = config['guild_id']
         try:
-            cursor = self.db.guild_configs.find({'voice_enabled': True})
-            configs = await cursor.to_list(length=1000)
-            for config in configs:
-                guild_id = config['guild_id']
-                tz_name = config.get('timezone', 'UTC')
-                try:
-                    # Validate timezone
-                    if tz_name not in pytz.all_timezones:
-                        self.logger.warning(f"Invalid timezone '{tz_name}' for guild {guild_id}, using UTC")
-                        tz_name = 'UTC'
-                    tz = pytz.timezone(tz_name)
-                    now = datetime.now(tz)
-                    # Check for reset window (midnight to 1 AM)
-                    if 0 <= now.hour < 1:
-                        # Check if already reset today
-                        last_reset = self.last_daily_reset.get(guild_id)
-                        if last_reset and last_reset.date() == now.date():
-                            continue  # Already reset today
-                        
-                        await self._reset_daily_stats(guild_id)
-                        self.last_daily_reset[guild_id] = now
-                except pytz.exceptions.UnknownTimeZoneError:
-                    self.logger.error(f"Invalid timezone for guild {guild_id}: {tz_name}")
-                except Exception as e:
-                    self.logger.error(f"Error checking daily reset for guild {guild_id}: {e}", exc_info=True)
+            # Check for reset window (midnight to 1 AM)
+            if 0 <= now.hour < 1:
+                # Check if already reset today
+                last_reset = self.last_daily_reset.get(guild_id)
+                if last_reset and last_reset.date() == now.date():
+                    return  # Already reset today
+                # Persisted marker survives restarts inside the reset window. Compare against
+                # today's local midnight: startup recovery also stamps it, at any hour
+                day_start = now.replace(hour=0, minute=0, second=0, microsecond=0).astimezone(pytz.UTC).replace(tzinfo=None)
+                last_db_reset = config.get('last_voice_daily_reset')
+                if last_db_reset and last_db_reset >= day_start:
+                    return
+                if not await self._claim_reset(guild_id, 'last_voice_daily_reset', day_start):
+                    return
+                
+                await self._reset_daily_stats(guild_id)
+                self.last_daily_reset[guild_id] = now
         except Exception as e:
-            self.logger.error(f"Error in daily_reset task: {e}", exc_info=True)
+            self.logger.error(f"Error checking daily reset for guild {guild_id}: {e}", exc_info=True)
     
-    @daily_reset.before_loop
-    async def before_daily_reset(self):
-        await self.bot.wait_until_ready()
-    
-    @tasks.loop(minutes=5)  # Check every 5 minutes
-    async def monthly_reset(self):
+    async def _maybe_monthly_reset(self, config: Dict, tz, now: datetime):
         """Check for monthly reset (1st of month midnight guild time)"""
+        guild_id = config['guild_id']
         try:
-            cursor = self.db.guild_configs.find({'voice_enabled': True})
-            configs = await cursor.to_list(length=1000)
-            for config in configs:
-                guild_id = config['guild_id']
-                tz_name = config.get('timezone', 'UTC')
-                try:
-                    # Validate timezone
-                    if tz_name not in pytz.all_timezones:
-                        self.logger.warning(f"Invalid timezone '{tz_name}' for guild {guild_id}, using UTC")
-                        tz_name = 'UTC'
-                    tz = pytz.timezone(tz_name)
-                    now = datetime.now(tz)
-                    # Check for monthly reset window (1st of month, midnight to 1 AM)
-                    if now.day == 1 and 0 <= now.hour < 1:
-                        # Check if already reset this month (use database as source of truth)
-                        last_db_reset = config.get('last_voice_monthly_reset')
-                        if last_db_reset:
-                            last_reset_tz = last_db_reset.replace(tzinfo=pytz.UTC).astimezone(tz)
-                            if last_reset_tz.month == now.month and last_reset_tz.year == now.year:
-                                continue  # Already reset this month
-                        
-                        await self._reset_monthly_stats(guild_id)
-                        self.last_monthly_reset[guild_id] = now
-                        # Persist to database for crash recovery
-                        await self.db.guild_configs.update_one(
-                            {'guild_id': guild_id},
-                            {'$set': {'last_voice_monthly_reset': datetime.utcnow()}}
-                        )
-                except Exception as e:
-                    self.logger.error(f"Error checking monthly reset for guild {guild_id}: {e}", exc_info=True)
+            # Check for monthly reset window (1st of month, midnight to 1 AM)
+            if now.day == 1 and 0 <= now.hour < 1:
+                # Check if already reset this month (use database as source of truth)
+                last_db_reset = config.get('last_voice_monthly_reset')
+                if last_db_reset:
+                    last_reset_tz = last_db_reset.replace(tzinfo=pytz.UTC).astimezone(tz)
+                    if last_reset_tz.month == now.month and last_reset_tz.year == now.year:
+                        return  # Already reset this month
+                # Start of this month in guild time, as naive UTC like the stored marker
+                month_start = now.replace(hour=0, minute=0, second=0, microsecond=0).astimezone(pytz.UTC).replace(tzinfo=None)
+                if not await self._claim_reset(guild_id, 'last_voice_monthly_reset', month_start):
+                    return
+                
+                await self._reset_monthly_stats(guild_id)
+                self.last_monthly_reset[guild_id] = now
         except Exception as e:
-            self.logger.error(f"Error in monthly_reset task: {e}", exc_info=True)
+            self.logger.error(f"Error checking monthly reset for guild {guild_id}: {e}", exc_info=True)
     
-    @monthly_reset.before_loop
-    async def before_monthly_reset(self):
-        await self.bot.wait_until_ready()
+    async def _claim_reset(self, guild_id: int, field: str, cutoff: datetime) -> bool:
+        """Atomically stamp a reset marker if it is missing or older than cutoff"""
+        claimed = await self.db.guild_configs.find_one_and_update(
+            {'guild_id': guild_id, '$or': [{field: None}, {field: {'$lt': cutoff}}]},
+            {'$set': {field: datetime.utcnow()}},
+            projection={'_id': 1}
+        )
+        return claimed is not None
+    
+    async def _finalize_session(self, session_key, now: datetime) -> bool:
+        """End a voice session and queue its capped time; True when the save queue should be flushed"""
+        joined_at = self.voice_sessions.pop(session_key, None)
+        if not isinstance(joined_at, datetime):
+            return False
+        minutes = (now - joined_at).total_seconds() / 60
+        if 0 < minutes < self.max_session_duration:  # Validate reasonable time
+            # Queue the save instead of immediate write
+            self.session_save_queue[session_key] += minutes
+            return len(self.session_save_queue) >= self.save_queue_batch_size
+        if minutes >= self.max_session_duration:
+            guild_id, user_id = session_key
+            self.logger.warning(f"Session exceeded max duration for user {user_id} in guild {guild_id}: {minutes:.1f} minutes")
+            await self._increment_voice_time(guild_id, user_id, self.max_session_duration)
+        return False
+    
+    def _start_session(self, session_key, joined_at: datetime):
+        """Start (or restart) a voice session, evicting the oldest past max_tracked_sessions"""
+        self.voice_sessions[session_key] = joined_at
+        self.voice_sessions.move_to_end(session_key)
+        while len(self.voice_sessions) > self.max_tracked_sessions:
+            evicted_key, evicted_at = self.voice_sessions.popitem(last=False)
+            minutes = min((datetime.utcnow() - evicted_at).total_seconds() / 60, self.max_session_duration)
+            if minutes > 0:
+                self.session_save_queue[evicted_key] += minutes
+            self.logger.warning(f"Session limit reached, evicted oldest session for user {evicted_key[1]} in guild {evicted_key[0]}")
+        if session_key not in self._session_heap_keys:
+            self._session_heap_keys.add(session_key)
+            heapq.heappush(self._session_heap, (joined_at + timedelta(minutes=self.max_session_duration), session_key))
     
     async def _cleanup_stale_sessions(self):
-        """Remove stale sessions to prevent memory leaks"""
+        """Remove stale sessions to prevent memory leaks (pops only the due heap entries)"""
         try:
             current_time = datetime.utcnow()
+            max_duration = timedelta(minutes=self.max_session_duration)
             stale_sessions = []
             
-            for session_key, joined_at in self.voice_sessions.items():
-                if isinstance(joined_at, datetime):
-                    duration = (current_time - joined_at).total_seconds() / 60
-                    # Remove sessions older than max duration
-                    if duration > self.max_session_duration:
-                        stale_sessions.append(session_key)
+            heap = self._session_heap
+            while heap and heap[0][0] < current_time:
+                _, session_key = heapq.heappop(heap)
+                joined_at = self.voice_sessions.get(session_key)
+                if not isinstance(joined_at, datetime):
+                    self._session_heap_keys.discard(session_key)
+                elif joined_at + max_duration >= current_time:
+                    heapq.heappush(heap, (joined_at + max_duration, session_key))
+                else:
+                    self._session_heap_keys.discard(session_key)
+                    stale_sessions.append(session_key)
             
             for session_key in stale_sessions:
                 guild_id, user_id = session_key
@@ -1080,15 +1497,35 @@ class VoiceLeaderboardCog(commands.Cog):
             return
         
         try:
-            queue_copy = self.session_save_queue.copy()
-            self.session_save_queue.clear()
+            queue_copy, self.session_save_queue = self.session_save_queue, defaultdict(float)
             
-            for (guild_id, user_id), minutes in queue_copy.items():
-                await self._increment_voice_time(guild_id, user_id, minutes)
-                self.logger.debug(f"Processed queued save: {minutes:.2f} minutes for user {user_id}")
+            # One bulk_write for the whole queue instead of a round trip per user
+            failed = await self._bulk_increment_voice_time(queue_copy.items())
+            # Hand only the minutes that did not land to the coalescing buffer so the next flush retries them
+            for session_key, minutes in failed:
+                self._pending_inc[session_key] += minutes
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Processed {len(queue_copy) - len(failed)} queued voice saves")
+            for guild_id in {guild_id for guild_id, _ in queue_copy}:
+                self._invalidate_embed_cache(guild_id)
         except Exception as e:
             self.logger.error(f"Error processing save queue: {e}")
     
+    @tasks.loop(seconds=30)
+    async def flush_save_queue(self):
+        """Write queued session time at least every 30s, however few members are queued"""
+        if not self.session_save_queue:
+            return
+        try:
+            async with self.voice_sessions_lock:
+                await self._process_save_queue()
+        except Exception as e:
+            self.logger.error(f"Error in flush_save_queue task: {e}", exc_info=True)
+    
+    @flush_save_queue.before_loop
+    async def before_flush_save_queue(self):
+        await self.bot.wait_until_ready()
+    
     @tasks.loop(minutes=10)
     async def save_voice_sessions_periodically(self):
         """
@@ -1100,6 +1537,7 @@ class VoiceLeaderboardCog(commands.Cog):
             await self._process_save_queue()
             
             if not self.voice_sessions:
+                await self._flush_pending_inc()
                 return
             
             async with self.voice_sessions_lock:
@@ -1131,13 +1569,17 @@ class VoiceLeaderboardCog(commands.Cog):
                 # Save in batches
                 for (guild_id, user_id), minutes in sessions_to_update:
                     await self._increment_voice_time(guild_id, user_id, minutes)
-                    # Reset session start time to now (so we don't double-count)
+                    # Reset session start time to now (so we don't double-count); the
+                    # existing expiry heap entry is rescheduled lazily on cleanup
                     if (guild_id, user_id) in self.voice_sessions:
                         self.voice_sessions[(guild_id, user_id)] = current_time
                     saved_count += 1
                 
                 if saved_count > 0 or error_count > 0:
                     self.logger.debug(f"Periodic save: {saved_count} saved, {error_count} errors, {len(self.voice_sessions)} active")
+            
+            # Write everything accumulated since the last flush in one round trip
+            await self._flush_pending_inc()
         
         except Exception as e:
             self.logger.error(f"Error in save_voice_sessions_periodically task: {e}", exc_info=True)
@@ -1156,9 +1598,38 @@ class VoiceLeaderboardCog(commands.Cog):
             if len(self.voice_sessions) > 0:
                 self.logger.debug(f"Running periodic session cleanup ({len(self.voice_sessions)} active sessions)")
                 await self._cleanup_stale_sessions()
+            await self._gc_sweep()
         except Exception as e:
             self.logger.error(f"Error in periodic session cleanup: {e}", exc_info=True)
     
+    async def _gc_sweep(self):
+        """Drop per-guild state of guilds that left or disabled voice tracking"""
+        live = {
+            config['guild_id']
+            async for config in self.db.guild_configs.find({'voice_enabled': True}, projection={'_id': 0, 'guild_id': 1})
+            if self.bot.get_guild(config['guild_id'])
+        }
+        removed = 0
+        for cache in (self.last_daily_reset, self.last_weekly_reset, self.last_monthly_reset,
+                      self._msg_cache, self._embed_cache, self._last_month_cache, self._cfg_cache,
+                      self._afk_cache):
+            for guild_id in [k for k in cache if k not in live]:
+                del cache[guild_id]
+                removed += 1
+        for cache in (self.view_cache, self._last_embed_hash):
+            for cache_key in [k for k in cache if k[0] not in live]:
+                del cache[cache_key]
+                removed += 1
+        self._dirty_guilds &= live
+        
+        # Sessions of dead guilds are dropped, not saved - their stats are gone or frozen
+        if any(guild_id not in live for guild_id, _ in self.voice_sessions):
+            before = len(self.voice_sessions)
+            self.voice_sessions = OrderedDict((k, v) for k, v in self.voice_sessions.items() if k[0] in live)
+            removed += before - len(self.voice_sessions)
+        if removed:
+            self.logger.debug(f"GC sweep dropped {removed} entries of inactive guilds")
+    
     @periodic_session_cleanup.before_loop
     async def before_periodic_session_cleanup(self):
         await self.bot.wait_until_ready()
@@ -1166,35 +1637,53 @@ class VoiceLeaderboardCog(commands.Cog):
     async def _reset_daily_stats(self, guild_id: int):
         """Reset daily voice stats"""
         try:
+            await self._flush_pending_inc()
+            # Only touch rows that actually hold time (served by the lb_voice_daily partial index)
             await self.db.user_stats.update_many(
-                {'guild_id': guild_id},
+                {'guild_id': guild_id, 'voice_daily': {'$gt': 0}},
                 {'$set': {'voice_daily': 0}}
             )
+            self._invalidate_embed_cache(guild_id)
+            self._forget_embed_hashes(guild_id)
             self.logger.info(f"Reset daily voice stats for guild {guild_id}")
         except Exception as e:
             self.logger.error(f"Error resetting daily stats for guild {guild_id}: {e}", exc_info=True)
     
+    async def _archive_voice_stats(self, guild_id: int, period: str):
+        """Archive non-zero voice stats for a period into weekly_history server-side"""
+        field = f'voice_{period}'
+        pipeline = [
+            {'$match': {'guild_id': guild_id, field: {'$gt': 0}}},
+            {'$project': {'_id': 0, 'user_id': 1, field: 1}},
+            {'$group': {'_id': None, 'stats': {'$push': '$$ROOT'}}},
+            # Drop the null group key so $merge inserts a fresh archive document
+            {'$unset': '_id'},
+            {'$addFields': {'guild_id': guild_id, 'type': 'voice', 'period': period, 'reset_date': '$$NOW'}},
+            {'$merge': {'into': 'weekly_history'}}
+        ]
+        await self.db.user_stats.aggregate(pipeline, hint=f'lb_{field}').to_list(length=None)
+    
     async def _reset_monthly_stats(self, guild_id: int):
         """Reset monthly voice stats and archive data"""
         try:
-            cursor = self.db.user_stats.find({'guild_id': guild_id, 'voice_monthly': {'$gt': 0}})
-            stats = await cursor.to_list(length=10000)
-            if stats:
-                archive_doc = {'guild_id': guild_id, 'type': 'voice', 'period': 'monthly', 'reset_date': datetime.utcnow(), 'stats': stats}
-                await self.db.weekly_history.insert_one(archive_doc)
-            await self.db.user_stats.update_many({'guild_id': guild_id}, {'$set': {'voice_monthly': 0}})
+            await self._flush_pending_inc()
+            await self._archive_voice_stats(guild_id, 'monthly')
+            await self.db.user_stats.update_many({'guild_id': guild_id, 'voice_monthly': {'$gt': 0}}, {'$set': {'voice_monthly': 0}})
+            self._invalidate_embed_cache(guild_id)
+            self._forget_embed_hashes(guild_id)
+            # A new archive exists - guild timezones may reset after the cached UTC expiry
+            self._last_month_cache.pop(guild_id, None)
             self.logger.info(f"Archived and reset monthly voice stats for guild {guild_id}")
         except Exception as e:
             self.logger.error(f"Error resetting monthly stats for guild {guild_id}: {e}", exc_info=True)
     
     async def _reset_weekly_stats(self, guild_id: int):
         try:
-            cursor = self.db.user_stats.find({'guild_id': guild_id, 'voice_weekly': {'$gt': 0}})
-            stats = await cursor.to_list(length=10000)
-            if stats:
-                archive_doc = {'guild_id': guild_id, 'type': 'voice', 'period': 'weekly', 'reset_date': datetime.utcnow(), 'stats': stats}
-                await self.db.weekly_history.insert_one(archive_doc)
-            await self.db.user_stats.update_many({'guild_id': guild_id}, {'$set': {'voice_weekly': 0}})
+            await self._flush_pending_inc()
+            await self._archive_voice_stats(guild_id, 'weekly')
+            await self.db.user_stats.update_many({'guild_id': guild_id, 'voice_weekly': {'$gt': 0}}, {'$set': {'voice_weekly': 0}})
+            self._invalidate_embed_cache(guild_id)
+            self._forget_embed_hashes(guild_id)
             self.logger.info(f"Archived and reset weekly voice stats for guild {guild_id}")
         except Exception as e:
             self.logger.error(f"Error resetting weekly stats for guild {guild_id}: {e}", exc_info=True)
@@ -1234,12 +1723,10 @@ class VoiceLeaderboardCog(commands.Cog):
             
             # Task status
             debug_info += f"\n## 🔄 Background Tasks\n"
-            debug_info += f"**Update Task:** {'✅ Running' if self.update_leaderboards.is_running() else '❌ NOT RUNNING'}\n"
-            debug_info += f"**Daily Reset:** {'✅ Running' if self.daily_reset.is_running() else '❌ NOT RUNNING'}\n"
-            debug_info += f"**Weekly Reset:** {'✅ Running' if self.weekly_reset.is_running() else '❌ NOT RUNNING'}\n"
-            debug_info += f"**Monthly Reset:** {'✅ Running' if self.monthly_reset.is_running() else '❌ NOT RUNNING'}\n"
+            debug_info += f"**Update & Reset Tick:** {'✅ Running' if self.unified_tick.is_running() else '❌ NOT RUNNING'}\n"
             debug_info += f"**Save Sessions:** {'✅ Running' if self.save_voice_sessions_periodically.is_running() else '❌ NOT RUNNING'}\n"
             debug_info += f"**Session Cleanup:** {'✅ Running' if self.periodic_session_cleanup.is_running() else '❌ NOT RUNNING'}\n"
+            debug_info += f"**Save Queue Flush:** {'✅ Running' if self.flush_save_queue.is_running() else '❌ NOT RUNNING'}\n"
             
             # Check message data
             msg_data = await self._get_leaderboard_message(guild_id)
@@ -1297,7 +1784,7 @@ class VoiceLeaderboardCog(commands.Cog):
             debug_info += f"\n## 💡 Recommendations\n"
             if not config.get('voice_enabled'):
                 debug_info += f"⚠️ Enable the leaderboard with `/live-leaderboard-voice action:Enable`\n"
-            if not self.update_leaderboards.is_running():
+            if not self.unified_tick.is_running():
                 debug_info += f"⚠️ Update task not running - restart the bot\n"
             if not msg_data:
                 debug_info += f"⚠️ No leaderboard messages - run `/live-leaderboard-voice action:Setup`\n"
@@ -1323,6 +1810,7 @@ class VoiceLeaderboardCog(commands.Cog):
         app_commands.Choice(name="Setup", value="setup")
     ])
     @app_commands.checks.has_permissions(administrator=True)
+    @_safe_followup
     async def setup_voice_leaderboard(
         self, 
         interaction: discord.Interaction, 
@@ -1333,111 +1821,98 @@ class VoiceLeaderboardCog(commands.Cog):
     ):
         await interaction.response.defer(ephemeral=True)
         
-        try:
-            config = await self._get_guild_config(interaction.guild.id)
-            
-            # Handle disable action
-            if action.value == "disable":
-                if not config or not config.get('voice_enabled'):
-                    await interaction.followup.send("⚠️ Voice leaderboard is already disabled!", ephemeral=True)
-                    return
-                
-                await self.db.guild_configs.update_one(
-                    {'guild_id': interaction.guild.id},
-                    {'$set': {'voice_enabled': False}}
-                )
-                await interaction.followup.send(
-                    "✅ **Voice leaderboard disabled!**\n"
-                    "📊 Voice time tracking has been paused.\n"
-                    "💡 Use `/live-leaderboard-voice action:Enable` to re-enable.",
-                    ephemeral=True
-                )
-                return
-            
-            # Handle enable action
-            if action.value == "enable":
-                if not config:
-                    await interaction.followup.send(
-                        "⚠️ Voice leaderboard not configured yet!\n"
-                        "💡 Use `/live-leaderboard-voice action:Setup` first.",
-                        ephemeral=True
-                    )
-                    return
-                
-                if config.get('voice_enabled'):
-                    await interaction.followup.send("⚠️ Voice leaderboard is already enabled!", ephemeral=True)
-                    return
-                
-                await self.db.guild_configs.update_one(
-                    {'guild_id': interaction.guild.id},
-                    {'$set': {'voice_enabled': True}}
-                )
-                
-                channel_id = config.get('voice_channel_id')
-                channel_mention = f"<#{channel_id}>" if channel_id else "Not set"
-                
-                await interaction.followup.send(
-                    f"✅ **Voice leaderboard enabled!**\n"
-                    f"📊 Channel: {channel_mention}\n"
-                    f"🌍 Timezone: `{config.get('timezone', 'UTC')}`\n"
-                    f"💡 Voice time tracking has resumed.",
-                    ephemeral=True
-                )
-                return
-            
-            # Handle setup action
-            if action.value == "setup":
-                if not voice_channel:
-                    await interaction.followup.send(
-                        "❌ **Channel required for setup!**\n"
-                        "Please provide a channel using the `voice_channel` parameter.",
-                        ephemeral=True
-                    )
-                    return
-                
-                # Validate timezone
-                try:
-                    pytz.timezone(timezone)
-                except pytz.exceptions.UnknownTimeZoneError:
-                    await interaction.followup.send(
-                        f"❌ Invalid timezone: `{timezone}`\n"
-                        f"💡 Use IANA format (e.g., `America/New_York`, `Europe/London`, `Asia/Tokyo`)",
-                        ephemeral=True
-                    )
-                    return
-                
-                await self._ensure_guild_config(interaction.guild.id)
-                
-                # Prepare update data
-                update_data = {
-                    'voice_enabled': True, 
-                    'voice_channel_id': voice_channel.id, 
-                    'timezone': timezone
-                }
-                
-                # Add vibe_channel if provided
-                if vibe_channel:
-                    update_data['vibe_channel_id'] = vibe_channel.id
-                
-                await self.db.guild_configs.update_one(
-                    {'guild_id': interaction.guild.id},
-                    {'$set': update_data}
-                )
-                
-                await self._create_full_leaderboard_message(voice_channel, interaction.guild.id, vibe_channel.id if vibe_channel else None)
-                
-                vibe_info = f"\n🎵 Vibe Channel: {vibe_channel.mention}" if vibe_channel else ""
-                await interaction.followup.send(
-                    f"✅ **Voice leaderboard setup complete!**\n"
-                    f"📊 Channel: {voice_channel.mention}\n"
-                    f"🌍 Timezone: `{timezone}`{vibe_info}\n"
-                    f"🔄 Updates every 5 minutes\n"
-                    f"💡 Use `/live-leaderboard-voice action:Disable` to pause tracking.",
-                    ephemeral=True
-                )
+        handler = self._dispatch.get(action.value)
+        if handler:
+            await handler(interaction, voice_channel, timezone, vibe_channel)
+    
+    async def _handle_enable(self, interaction: discord.Interaction, voice_channel, timezone, vibe_channel):
+        await self._handle_toggle(interaction, True)
+    
+    async def _handle_disable(self, interaction: discord.Interaction, voice_channel, timezone, vibe_channel):
+        await self._handle_toggle(interaction, False)
+    
+    async def _handle_toggle(self, interaction: discord.Interaction, desired: bool):
+        """Enable or disable tracking - no Mongo write unless the state actually changes"""
+        send = functools.partial(interaction.followup.send, ephemeral=True)
+        # Only the toggles need the current config - setup overwrites it blindly
+        config = await self._get_guild_config(interaction.guild.id)
+        if desired and not config:
+            await send(embed=self._embed_not_configured)
+            return
         
-        except Exception as e:
-            await interaction.followup.send(f"❌ Error: {e}", ephemeral=True)
+        if bool(config and config.get('voice_enabled')) == desired:
+            await send(embed=self._embed_already_enabled if desired else self._embed_already_disabled)
+            return
+        
+        # Toggles are coalesced into a bulk_write; the cache serves the new state meanwhile
+        self._queue_config_set(interaction.guild.id, {'voice_enabled': desired})
+        
+        if not desired:
+            await send(MSG_DISABLED)
+            return
+        
+        channel_id = config.get('voice_channel_id')
+        channel_mention = "<#%d>" % channel_id if channel_id is not None else "Not set"
+        
+        await send(MSG_ENABLED_FMT.format(channel=channel_mention, tz=config.get('timezone', 'UTC')))
+    
+    async def _handle_setup(self, interaction: discord.Interaction, voice_channel: Optional[discord.TextChannel],
+                            timezone: str, vibe_channel: Optional[discord.TextChannel]):
+        """Configure channel, timezone and vibe channel, then post fresh leaderboard messages"""
+        send = functools.partial(interaction.followup.send, ephemeral=True)
+        if not voice_channel:
+            await send(embed=self._embed_channel_required)
+            return
+        
+        # Validate timezone through the cached lookup the tick uses
+        tz = _safe_tz(timezone)
+        if tz is None:
+            await send(MSG_INVALID_TZ_FMT.format(tz=timezone))
+            return
+        
+        vibe_id = vibe_channel.id if vibe_channel else None
+        vibe_mention = vibe_channel.mention if vibe_channel else ''
+        
+        # Prepare update data
+        update_data = {
+            'voice_enabled': True, 
+            'voice_channel_id': voice_channel.id, 
+            'timezone': timezone
+        }
+        
+        # Add vibe_channel if provided
+        if vibe_id:
+            update_data['vibe_channel_id'] = vibe_id
+        
+        # Setup overrides any queued toggle: drop it, and wait out a batch already in flight
+        # so a stale voice_enabled can't land after this upsert
+        async with self._config_flush_lock:
+            self._pending_config_sets.pop(interaction.guild.id, None)
+            # One upsert creates the config if needed - defaults not covered by $set go in $setOnInsert.
+            # The primary hands back the projected document, which seeds the cache so the next
+            # read can't cache a lagging secondary's stale "not configured"
+            config = await self.db.guild_configs.find_one_and_update(
+                {'guild_id': interaction.guild.id},
+                {'$set': update_data, '$setOnInsert': {'leaderboard_limit': 10, 'created_at': datetime.utcnow()}},
+                projection=CONFIG_PROJECTION,
+                upsert=True,
+                return_document=ReturnDocument.AFTER
+            )
+        self._cfg_cache[interaction.guild.id] = (time.monotonic(), config)
+        
+        # Post the leaderboard in the background, concurrently with the reply below;
+        # the validated tz is handed over so the post needs no config read of its own
+        task = asyncio.create_task(
+            self._create_full_leaderboard_message(voice_channel, interaction.guild.id, vibe_id, tz=tz)
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._log_task_error)
+        
+        if vibe_mention:
+            reply = MSG_SETUP_VIBE_FMT.format(channel=voice_channel.mention, tz=timezone, vibe=vibe_mention)
+        else:
+            reply = MSG_SETUP_FMT.format(channel=voice_channel.mention, tz=timezone)
+        await send(reply)
 
 
 async def setup(bot: commands.Bot):